@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+A compact binary treebank format which can be memory-mapped, so that
+repeated passes over a treebank do not need to parse CoNLL-U again.
+
+All numbers are little-endian and every section starts at a multiple of 8 bytes:
+
+  header         MAGIC, then uint64 string count, blob size, sentence count,
+                 row count and comment count
+  str_offsets    uint64[strings+1]   string i is blob[str_offsets[i]:str_offsets[i+1]]
+  blob           UTF-8 bytes of all the distinct strings
+  sent_rows      uint64[sentences+1] rows of sentence i are sent_rows[i]:sent_rows[i+1]
+  sent_comments  uint64[sentences+1] the same for its comments
+  comments       uint32[comments]    string codes of the comment lines
+  cells          uint32[10*rows]     string codes of all columns, column by column,
+                                     column c of row r is cells[c*rows+r]
+  ids            int32[rows]         the ID as a number, -1 for multiword tokens, -2 for empty nodes
+  heads          int32[rows]         the HEAD as a number, -1 if it is not one
+
+Every column value (FEATS, MISC and DEPS included) is an interned string, so
+decoding gives back exactly the CoNLL-U text that was encoded.
+"""
+
+import sys
+import array
+import mmap
+import struct
+import argparse
+import file_util
+from file_util import COLCOUNT,ID,HEAD
+
+MAGIC=b"UDBIN\x01\x00\x00"
+HEADER=struct.Struct("<8s5Q")
+
+if sys.byteorder!="little": #The arrays are written and mapped in the native byte order
+    raise ImportError("binary_util only supports little-endian machines")
+
+def padding(size):
+    return b"\0"*(-size%8)
+
+def write_binary(trees,out):
+    """
+    Encodes `trees`, an iterable of (comments,tree) pairs as produced by
+    file_util.trees(), into the binary file-like object `out`.
+    """
+    codes={} #key: string value: its code
+    str_offsets=array.array("Q",[0])
+    blob=bytearray()
+    sent_rows=array.array("Q",[0])
+    sent_comments=array.array("Q",[0])
+    comments_arr=array.array("I")
+    columns=[array.array("I") for _ in range(COLCOUNT)]
+    ids=array.array("i")
+    heads=array.array("i")
+
+    def code(s):
+        c=codes.get(s)
+        if c is None:
+            c=codes[s]=len(codes)
+            blob.extend(s.encode("utf-8"))
+            str_offsets.append(len(blob))
+        return c
+
+    for comments,tree in trees:
+        for comment in comments:
+            comments_arr.append(code(comment))
+        for cols in tree:
+            for c,value in enumerate(cols):
+                columns[c].append(code(value))
+            if cols[ID].isdigit():
+                ids.append(int(cols[ID]))
+            else:
+                ids.append(-1 if u"-" in cols[ID] else -2)
+            heads.append(int(cols[HEAD]) if cols[HEAD].isdigit() else -1)
+        sent_rows.append(len(ids))
+        sent_comments.append(len(comments_arr))
+
+    header=HEADER.pack(MAGIC,len(codes),len(blob),len(sent_rows)-1,len(ids),len(comments_arr))
+    out.write(header+padding(len(header)))
+    cells=b"".join(column.tobytes() for column in columns)
+    for section in (str_offsets.tobytes(),bytes(blob),sent_rows.tobytes(),sent_comments.tobytes(),comments_arr.tobytes(),cells,ids.tobytes(),heads.tobytes()):
+        out.write(section+padding(len(section)))
+
+class BinaryTreebank(object):
+    """
+    A memory-mapped binary treebank. len() is the number of sentences,
+    tb[i] is the (comments,tree) pair of sentence i with rows as tuples of
+    columns and iterating gives all of them, like file_util.trees().
+    column() and heads() give zero-copy memoryviews into the mapped file. They
+    stay valid after close(), the file is unmapped once the last of them is
+    released (or garbage collected).
+    """
+
+    def __init__(self,f_name):
+        self.file=open(f_name,"rb")
+        self.views=[] #the views of the sections, released by close()
+        try:
+            self.mmap=mmap.mmap(self.file.fileno(),0,access=mmap.ACCESS_READ)
+        except BaseException: #e.g. an empty file
+            self.file.close()
+            raise
+        try:
+            self.view=memoryview(self.mmap)
+            self.views.append(self.view)
+            if len(self.mmap)<HEADER.size or HEADER.unpack_from(self.mmap,0)[0]!=MAGIC:
+                raise ValueError("%s is not a binary treebank"%f_name)
+            self.open_sections()
+        except BaseException:
+            self.close()
+            raise
+        self.strings=[None]*self.n_strings #decoded strings, filled on demand
+
+    def open_sections(self):
+        magic,n_strings,blob_size,n_sents,n_rows,n_comments=HEADER.unpack_from(self.mmap,0)
+        self.n_strings=n_strings
+        self.n_rows=n_rows
+        self.pos=HEADER.size
+        self.str_offsets=self.section("Q",n_strings+1)
+        self.blob=self.section("B",blob_size)
+        self.sent_rows=self.section("Q",n_sents+1)
+        self.sent_comments=self.section("Q",n_sents+1)
+        self.comments=self.section("I",n_comments)
+        self.cells=self.section("I",COLCOUNT*n_rows)
+        self.ids=self.section("i",n_rows)
+        self.head_arr=self.section("i",n_rows)
+
+    def section(self,fmt,count):
+        """The next section of the file, of `count` items of struct format `fmt`"""
+        self.pos+=-self.pos%8
+        size=struct.calcsize(fmt)*count
+        view=self.view[self.pos:self.pos+size].cast(fmt)
+        self.views.append(view)
+        self.pos+=size
+        return view
+
+    def string(self,code):
+        s=self.strings[code]
+        if s is None:
+            s=self.strings[code]=str(self.blob[self.str_offsets[code]:self.str_offsets[code+1]],"utf-8")
+        return s
+
+    def __len__(self):
+        return len(self.sent_rows)-1
+
+    def __getitem__(self,i):
+        if i<0:
+            i+=len(self)
+        string=self.string
+        comments=[string(c) for c in self.comments[self.sent_comments[i]:self.sent_comments[i+1]]]
+        columns=[[string(c) for c in self.column(i,col)] for col in range(COLCOUNT)]
+        return comments,list(zip(*columns))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self,i,col):
+        """The string codes of column `col` of sentence i, decode them with string()"""
+        return self.cells[col*self.n_rows+self.sent_rows[i]:col*self.n_rows+self.sent_rows[i+1]]
+
+    def heads(self,i):
+        """The numeric HEADs of sentence i, -1 where HEAD is not a number"""
+        return self.head_arr[self.sent_rows[i]:self.sent_rows[i+1]]
+
+    def close(self):
+        for view in self.views:
+            view.release()
+        self.views=[]
+        try:
+            self.mmap.close()
+        except BufferError: #views from column() or heads() are still in use, they keep the mapping until released
+            pass
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc_info):
+        self.close()
+
+if __name__=="__main__":
+    opt_parser = argparse.ArgumentParser(description='Conversion between CoNLL-U and the binary treebank format. The input is assumed to be valid CoNLL-U.')
+    opt_parser.add_argument('direction', choices=['encode','decode'], help='encode: CoNLL-U to binary, decode: binary to CoNLL-U.')
+    opt_parser.add_argument('input', help='Input file name, or "-" for standard input when encoding.')
+    opt_parser.add_argument('output', nargs='?', help='Output file name. When decoding, "-" or nothing for standard output.')
+    args = opt_parser.parse_args() #Parsed command-line arguments
+
+    if args.direction=="encode":
+        if not args.output or args.output=="-":
+            print("The binary output needs a file name.",file=sys.stderr)
+            sys.exit(1)
+        try:
+            with open(args.output,"wb") as out:
+                write_binary(file_util.trees(file_util.open_input(args.input)),out)
+        except file_util.ConlluFormatError as e:
+            print("%s Giving up."%e,file=sys.stderr)
+            sys.exit(1)
+    else:
+        out=file_util.open_output(args.output)
+        with BinaryTreebank(args.input) as tb:
+            for comments,tree in tb:
+                out.write_tree(comments,tree)
+        out.close()
@@ -1,64 +1,174 @@
+#!/usr/bin/env python3
+
+import os
 import sys
-import re
-import file_util
-from file_util import ID,FORM,HEAD,DEPREL,DEPS #column index for the columns we'll need
+import json
+import struct
 import argparse
+import file_util
+from file_util import ID,FORM,LEMMA,CPOSTAG,POSTAG,HEAD,DEPREL,DEPS,MISC #column index for the columns we'll need
 
-def w2t(wtree):
-    tokens=get_tokens(wtree)
-    word_ids=[u"0"] #root remains 0
-    line_idx=0 #index of the line in wtree we are editing
-    for token_idx,(b,e) in enumerate(tokens): #go over all token ranges and produce new IDs for the words involved
-        wtree[line_idx][ID]=unicode(token_idx+1) #Renumber the ID field of the token
-        if b==e: #token==word
-            word_ids.append("%d"%(token_idx+1))
-            line_idx+=1
-        else:
-            #We have a range, renumber the words
-            line_idx+=1
-            for word_idx,_ in enumerate(range(b,e+1)): #consume as many lines as there are words in the token
-                word_ids.append("%d.%d"%(token_idx+1,word_idx+1))
-                wtree[line_idx][ID]=word_ids[-1]
-                line_idx+=1
-    #word_ids is now a list with 1-based indexing which has the new ID for every single word
-    #the ID column has been renumbered by now
-    #now we can renumber all of the HEAD columns
-    for cols in wtree:
-        if cols[HEAD]==u"_": #token
-            continue
-        cols[HEAD]=word_ids[int(cols[HEAD])]
-        if cols[DEPS]!=u"_": #need to renumber secondary deps
-            new_pairs=[]
-            for head_deprel in cols[DEPS].split(u"|"):
-                head,deprel=head_deprel.split(u":")
-                new_pairs.append(word_ids[int(head)]+u":"+deprel)
-            cols[DEPS]=u"|".join(new_pairs)
+OUTPUT_FORMATS={} #key: format name value: writer class
 
-if __name__=="__main__":
-    opt_parser = argparse.ArgumentParser(description='Conversion script from word-based CoNLL-U to other formats.')
-    opt_parser.add_argument('input', nargs='?', help='Input file name, or "-" or nothing for standard input.')
-    opt_parser.add_argument('output', nargs='?', help='Output file name, or "-" or nothing for standard output.')
-    opt_parser.add_argument('-f','--output-format', default="dgraph", help='Output format. Currently supported: dgraph (CoreNLP dep output). Default: %(default)s.')
-    args = opt_parser.parse_args() #Parsed command-line arguments
+def output_format(name):
+    """Class decorator registering a writer class as output format `name`"""
+    def register(cls):
+        cls.name=name
+        OUTPUT_FORMATS[name]=cls
+        return cls
+    return register
+
+class FormatWriter(object):
+    """
+    Base class of the output formats. Every tree of the input is passed to
+    write_tree() in one pass, `out` is a file_util.TreeWriter.
+    """
 
-    inp,out=file_util.in_out(args)
-    for comments,tree in file_util.trees(inp):
-        deps=set() #A set of (gov,dep,dType) where gov and dep are zero-based indices
+    def __init__(self,out):
+        self.out=out
+
+    def write_tree(self,comments,tree):
+        raise NotImplementedError
+
+    def close(self):
+        self.out.close()
+
+@output_format("dgraph")
+class DgraphWriter(FormatWriter):
+    """CoreNLP dependency output, deprel(gov-i, dep-j) lines sorted by governor"""
+
+    def write_tree(self,comments,tree):
+        forms=[u"ROOT"] #word forms by word id
+        deps=set() #A set of (gov,dep,dType) where gov and dep are word ids
         for line in tree:
-            if not line[ID].isdigit(): #token line, skip
+            if not line[ID].isdigit(): #token line or empty node, skip
                 continue
+            forms.append(line[FORM])
             if line[HEAD] not in (u"_",u"0"):
-                deps.add((int(line[HEAD])-1,int(line[ID])-1,line[DEPREL]))
+                deps.add((int(line[HEAD]),int(line[ID]),line[DEPREL]))
             #Process also the DEPS field
             if line[DEPS]!=u"_":
                 for head_col_deprel in line[DEPS].split(u"|"):
                     head,deprel=head_col_deprel.split(u":",1)
-                    deps.add((int(head)-1,int(line[ID])-1,line[DEPREL]))
-        #Done. Maybe these should be sorted somehow? Also, what to do if we have no deps?
+                    if head.isdigit() and head!=u"0": #empty nodes have no place in this format
+                        deps.add((int(head),int(line[ID]),deprel))
         for gov,dep,deprel in sorted(deps):
-            print >> out, u"%s(%s-%d, %s-%d)"%(deprel,tree[gov][FORM],gov+1,tree[dep][FORM],dep+1)
-        print >> out
+            self.out.write(u"%s(%s-%d, %s-%d)\n"%(deprel,forms[gov],gov,forms[dep],dep))
+        self.out.write(u"\n")
+
+@output_format("conllx")
+class ConllxWriter(FormatWriter):
+    """CoNLL-X, converted the same way as conllu_to_conllx.pl does"""
+
+    def write_tree(self,comments,tree):
+        rows=[]
+        for cols in tree:
+            if not cols[ID].isdigit(): #multiword token or empty node
+                continue
+            cols=list(cols)
+            cols[FORM]=cols[FORM].replace(u" ",u"_")
+            cols[LEMMA]=cols[LEMMA].replace(u" ",u"_")
+            cols[POSTAG]=cols[CPOSTAG] if cols[POSTAG]==u"_" else cols[CPOSTAG]+u"_"+cols[POSTAG]
+            cols[DEPS]=cols[MISC]=u"_" #PHEAD and PDEPREL in CoNLL-X
+            rows.append(u"\t".join(cols))
+        rows.append(u"\n")
+        self.out.write(u"\n".join(rows))
+
+@output_format("jsonl")
+class JsonlWriter(FormatWriter):
+    """One json object per sentence: {"comments": [...], "rows": [{"id": ..., "form": ..., ...}, ...]}"""
+
+    KEYS=(u"id",u"form",u"lemma",u"upos",u"xpos",u"feats",u"head",u"deprel",u"deps",u"misc")
+
+    def write_tree(self,comments,tree):
+        sent={u"comments":comments,u"rows":[dict(zip(self.KEYS,cols)) for cols in tree]}
+        self.out.write(json.dumps(sent,ensure_ascii=False)+u"\n")
+
+@output_format("text")
+class TextWriter(FormatWriter):
+    """One sentence per line, surface tokens separated by a space"""
+
+    def write_tree(self,comments,tree):
+        tokens=[]
+        last=0 #last word covered by a multiword token
+        for cols in tree:
+            if u"-" in cols[ID]:
+                tokens.append(cols[FORM])
+                last=int(cols[ID].split(u"-")[1])
+            elif cols[ID].isdigit() and int(cols[ID])>last:
+                tokens.append(cols[FORM])
+        self.out.write(u" ".join(tokens)+u"\n")
+
+@output_format("headbin")
+class HeadBinWriter(FormatWriter):
+    """
+    Compact binary heads and deprels, little-endian. The stream starts with
+    b"UDHB1\\n", followed by records:
+      b"D" uint16 length, UTF-8 name      defines the next deprel code (0,1,2,...)
+      b"S" uint16 n, n*uint16 heads, n*uint16 deprel codes     one sentence
+    Only basic tree words are stored, word i+1 of the sentence at index i.
+    """
+
+    MAGIC=b"UDHB1\n"
+
+    def __init__(self,out):
+        FormatWriter.__init__(self,out)
+        self.codes={} #key: deprel value: its code
+        self.buffer=bytearray(self.MAGIC)
+
+    def write_tree(self,comments,tree):
+        heads=[]
+        codes=[]
+        for cols in tree:
+            if not cols[ID].isdigit():
+                continue
+            code=self.codes.get(cols[DEPREL])
+            if code is None:
+                code=self.codes[cols[DEPREL]]=len(self.codes)
+                name=cols[DEPREL].encode("utf-8")
+                self.buffer+=b"D"+struct.pack("<H",len(name))+name
+            heads.append(int(cols[HEAD]) if cols[HEAD].isdigit() else 0) #HEAD _ is stored as 0, like the root
+            codes.append(code)
+        self.buffer+=struct.pack("<cH%dH"%(2*len(heads)),b"S",len(heads),*(heads+codes))
+        if len(self.buffer)>=file_util.BLOCK_SIZE:
+            self.out.write_bytes(bytes(self.buffer))
+            self.buffer=bytearray()
+
+    def close(self):
+        self.out.write_bytes(bytes(self.buffer))
+        FormatWriter.close(self)
+
+if __name__=="__main__":
+    opt_parser = argparse.ArgumentParser(description='Conversion script from word-based CoNLL-U to other formats. The input is read once and written in all the requested formats.')
+    opt_parser.add_argument('input', nargs='?', help='Input file name, or "-" or nothing for standard input.')
+    opt_parser.add_argument('output', nargs='?', help='Output file name, or "-" or nothing for standard output.')
+    opt_parser.add_argument('-f','--output-format', action='append', default=None, metavar='FORMAT[:FILE]', help='Output format, optionally with its own output file. Can be given several times. Currently supported: %s. Default: dgraph.'%(", ".join(sorted(OUTPUT_FORMATS))))
+    args = opt_parser.parse_args() #Parsed command-line arguments
 
-            
-            
+    targets=[]
+    for target in args.output_format or [u"dgraph"]:
+        name,_,f_name=target.partition(u":")
+        if name not in OUTPUT_FORMATS:
+            print("Unknown output format: %s. Use one of %s."%(name,", ".join(sorted(OUTPUT_FORMATS))),file=sys.stderr)
+            sys.exit(1)
+        targets.append((name,f_name or args.output or u"-"))
+    if sum(1 for _,f_name in targets if f_name==u"-")>1:
+        print("Only one output format can be written to the standard output.",file=sys.stderr)
+        sys.exit(1)
+    paths=[os.path.realpath(f_name) for _,f_name in targets if f_name!=u"-"]
+    if len(set(paths))<len(paths):
+        print("Each output format must be written to its own file.",file=sys.stderr)
+        sys.exit(1)
 
+    inp=file_util.open_input(args.input)
+    writers=[OUTPUT_FORMATS[name](file_util.open_output(f_name)) for name,f_name in targets]
+    try:
+        for comments,tree in file_util.trees(inp):
+            for writer in writers:
+                writer.write_tree(comments,tree)
+    except file_util.ConlluFormatError as e:
+        print("%s Giving up."%e,file=sys.stderr)
+        sys.exit(1)
+    finally:
+        for writer in writers:
+            writer.close()
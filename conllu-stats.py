@@ -1,15 +1,326 @@
 import sys
 import re
 import file_util
-from file_util import FORM,LEMMA,CPOSTAG,FEATS,DEPREL,DEPS #column index for the columns we'll need
+from file_util import ID,FORM,LEMMA,CPOSTAG,FEATS,HEAD,DEPREL,DEPS #column index for the columns we'll need
 import argparse
 import os
 import codecs 
 import json
 import traceback
+import hashlib
+import struct
+import heapq
+import math
+import random
+import array
+try:
+    import numpy
+except ImportError: #only needed for --columnar and --shape-stats
+    numpy=None
 
 THISDIR=os.path.dirname(os.path.abspath(__file__))
 
+def hash64(s):
+    """Stable 64-bit hash of a unicode string, shared by the sketches below"""
+    return struct.unpack("<Q",hashlib.md5(s.encode("utf-8")).digest()[:8])[0]
+
+class HyperLogLog(object):
+    """
+    Approximate count of distinct values (Flajolet et al. 2007) in 2**p one-byte
+    registers, i.e. 16kB for the default p=14, with ~0.8% standard error.
+    """
+
+    def __init__(self,p=14):
+        self.p=p
+        self.m=1<<p
+        self.registers=bytearray(self.m)
+        self.low_mask=(1<<(64-p))-1
+
+    def add_hash(self,h):
+        idx=h>>(64-self.p)
+        rank=(64-self.p)-(h&self.low_mask).bit_length()+1 #position of the leftmost 1-bit
+        if rank>self.registers[idx]:
+            self.registers[idx]=rank
+
+    def count(self):
+        m=self.m
+        alpha=0.7213/(1+1.079/m)
+        estimate=alpha*m*m/sum(2.0**-r for r in self.registers)
+        zeros=self.registers.count(b"\0")
+        if estimate<=2.5*m and zeros: #small range correction
+            estimate=m*math.log(float(m)/zeros)
+        return int(round(estimate))
+
+class CountMinTopK(object):
+    """
+    Count-Min sketch (Cormode & Muthukrishnan 2005) of `depth` x `width` counters
+    plus a min-heap keeping the `k` items with the highest estimated counts.
+    Overestimates counts by at most ~e*N/width with probability 1-e**-depth.
+    """
+
+    def __init__(self,k=20,width=1<<16,depth=4):
+        self.k=k
+        self.width=width
+        self.depth=depth
+        self.tables=[array.array("l",[0])*width for _ in range(depth)]
+        self.top={} #key: item value: estimated count, at most k items
+        self.heap=[] #(count,item) with stale entries, compacted when it grows too much
+
+    def add_hash(self,item,h):
+        h1,h2=h&0xFFFFFFFF,h>>32
+        est=None
+        for i,table in enumerate(self.tables):
+            j=(h1+i*h2)%self.width #double hashing gives us the `depth` hash functions
+            table[j]+=1
+            if est is None or table[j]<est:
+                est=table[j]
+        if item in self.top or len(self.top)<self.k:
+            self.top[item]=est
+        else:
+            while self.top.get(self.heap[0][1])!=self.heap[0][0]: #drop stale entries
+                heapq.heappop(self.heap)
+            if est<=self.heap[0][0]:
+                return
+            del self.top[heapq.heappop(self.heap)[1]]
+            self.top[item]=est
+        heapq.heappush(self.heap,(est,item))
+        if len(self.heap)>4*self.k:
+            self.heap=[(c,it) for it,c in self.top.items()]
+            heapq.heapify(self.heap)
+
+    def most_common(self):
+        return sorted(self.top.items(),key=lambda x:(-x[1],x[0]))
+
+class SketchStats(object):
+    """
+    Bounded-memory approximate statistics for corpora too large for exact vocabularies:
+    distinct forms and lemmas (HyperLogLog), their top-K frequencies (Count-Min)
+    and a reservoir sample of sentences for every deprel.
+    """
+
+    def __init__(self,topk=20,hll_precision=14,reservoir_size=5,seed=0):
+        self.forms=HyperLogLog(hll_precision)
+        self.lemmas=HyperLogLog(hll_precision)
+        self.top_forms=CountMinTopK(topk)
+        self.top_lemmas=CountMinTopK(topk)
+        self.reservoir_size=reservoir_size
+        self.deprel_seen={} #key: deprel value: number of sentences containing it
+        self.deprel_samples={} #key: deprel value: list of sampled sentences
+        self.random=random.Random(seed)
+
+    def count_tree(self,comments,tree):
+        deprels=set()
+        for cols in tree:
+            if not cols[0].isdigit(): #token or empty word
+                continue
+            h=hash64(cols[FORM])
+            self.forms.add_hash(h)
+            self.top_forms.add_hash(cols[FORM],h)
+            if cols[LEMMA]!=u"_":
+                h=hash64(cols[LEMMA])
+                self.lemmas.add_hash(h)
+                self.top_lemmas.add_hash(cols[LEMMA],h)
+            deprels.add(cols[DEPREL])
+        if not deprels:
+            return
+        sent=u" ".join(cols[FORM] for cols in tree if cols[0].isdigit())
+        for deprel in deprels: #Algorithm R, each sentence counts once per deprel
+            seen=self.deprel_seen.get(deprel,0)+1
+            self.deprel_seen[deprel]=seen
+            samples=self.deprel_samples.setdefault(deprel,[])
+            if len(samples)<self.reservoir_size:
+                samples.append(sent)
+            else:
+                j=self.random.randrange(seen)
+                if j<self.reservoir_size:
+                    samples[j]=sent
+
+    def get_stats(self):
+        """Returns a dictionary of the approximate stats"""
+        return {"distinct_forms":self.forms.count(),"distinct_lemmas":self.lemmas.count(),
+                "top_forms":self.top_forms.most_common(),"top_lemmas":self.top_lemmas.most_common(),
+                "deprel_samples":self.deprel_samples}
+
+class ColumnarWriter(object):
+    """
+    Collects one row per token line into compact arrays of interned integer codes
+    and saves them as NumPy .npy columns plus a vocab.json with the code tables:
+
+    kind.npy     int8   0=word 1=multiword token 2=empty node
+    upos.npy     int16  index into vocab["upos"], -1 for _
+    deprel.npy   int16  index into vocab["deprel"], -1 for _
+    feats.npy    uint8  (rows, ceil(len(vocab["feats"])/8)) bitsets, feature code c is bit c%8 of byte c//8
+    head.npy     int32  HEAD-ID, 0 for the root and for lines without a numeric HEAD
+    sentence.npy uint32 0-based index of the sentence
+    """
+
+    KINDS=[u"word",u"multiword",u"empty"]
+
+    def __init__(self,outdir):
+        self.outdir=outdir
+        self.vocabs={u"upos":{},u"deprel":{},u"feats":{}} #key: value  value: its code
+        self.kind=array.array("b")
+        self.upos=array.array("h")
+        self.deprel=array.array("h")
+        self.head=array.array("i")
+        self.sentence=array.array("I")
+        self.feat_codes=array.array("i") #feature codes of all rows, concatenated
+        self.feat_counts=array.array("i") #number of feature codes of each row
+        self.sent_count=0
+
+    def code(self,vocab,value):
+        if value==u"_":
+            return -1
+        vocab=self.vocabs[vocab]
+        c=vocab.get(value)
+        if c is None:
+            c=vocab[value]=len(vocab)
+        return c
+
+    def add_tree(self,tree):
+        for cols in tree:
+            #Parse the whole line before appending anything, so that a bad line cannot leave the columns with different lengths
+            if cols[ID].isdigit():
+                kind=0
+                head=int(cols[HEAD])-int(cols[ID]) if cols[HEAD].isdigit() and cols[HEAD]!=u"0" else 0
+            else:
+                kind=1 if u"-" in cols[ID] else 2
+                head=0
+            upos=self.code(u"upos",cols[CPOSTAG])
+            deprel=self.code(u"deprel",cols[DEPREL])
+            feat_codes=[]
+            if cols[FEATS]!=u"_":
+                for cat_is_vals in cols[FEATS].split(u"|"):
+                    cat,vals=cat_is_vals.split(u"=",1)
+                    for val in vals.split(u","):
+                        feat_codes.append(self.code(u"feats",cat+u"="+val))
+            self.kind.append(kind)
+            self.head.append(head)
+            self.upos.append(upos)
+            self.deprel.append(deprel)
+            self.sentence.append(self.sent_count)
+            self.feat_codes.extend(feat_codes)
+            self.feat_counts.append(len(feat_codes))
+        self.sent_count+=1
+
+    def save(self):
+        if not os.path.isdir(self.outdir):
+            os.makedirs(self.outdir)
+        def as_numpy(arr,dtype):
+            return numpy.frombuffer(arr,dtype=numpy.dtype(arr.typecode)).astype(dtype)
+        rows=len(self.kind)
+        n_feats=len(self.vocabs[u"feats"])
+        feats=numpy.zeros((rows,(n_feats+7)//8),dtype=numpy.uint8)
+        if len(self.feat_codes):
+            codes=as_numpy(self.feat_codes,numpy.int64)
+            row_idx=numpy.repeat(numpy.arange(rows),as_numpy(self.feat_counts,numpy.int64))
+            numpy.bitwise_or.at(feats,(row_idx,codes>>3),(1<<(codes&7)).astype(numpy.uint8))
+        columns={"kind":as_numpy(self.kind,numpy.int8),"upos":as_numpy(self.upos,numpy.int16),
+                 "deprel":as_numpy(self.deprel,numpy.int16),"feats":feats,
+                 "head":as_numpy(self.head,numpy.int32),"sentence":as_numpy(self.sentence,numpy.uint32)}
+        for name,column in columns.items():
+            numpy.save(os.path.join(self.outdir,name+".npy"),column)
+        vocab={u"kind":self.KINDS}
+        for name,codes in self.vocabs.items():
+            vocab[name]=sorted(codes,key=codes.get)
+        with codecs.open(os.path.join(self.outdir,"vocab.json"),"w","utf-8") as f:
+            f.write(json.dumps(vocab,ensure_ascii=False))
+
+class ShapeStats(object):
+    """
+    Tree shape statistics of the basic trees: sentence length, dependency length,
+    tree depth and branching factor histograms and the rate of non-projective arcs.
+    The head arrays of the sentences are collected into batches padded to the
+    same length and each batch is processed at once with NumPy. A batch holds at
+    most `batch_cells` cells of the (sentences x length x length) dominance matrix.
+    """
+
+    def __init__(self,batch_cells=1<<22):
+        self.batch_cells=batch_cells
+        self.batch=[] #list of lists of heads of the words of the sentences in the batch
+        self.batch_len=0 #length of the longest sentence in the batch
+        self.hists={} #key: histogram name value: numpy array of counts
+        self.tree_count=0
+        self.arc_count=0
+        self.nonproj_arc_count=0
+        self.nonproj_tree_count=0
+
+    def add_tree(self,tree):
+        heads=[int(cols[HEAD]) if cols[HEAD].isdigit() else 0 for cols in tree if cols[ID].isdigit()] #HEAD _ counts as the root
+        if not heads:
+            return
+        batch_len=max(self.batch_len,len(heads))
+        if self.batch and (len(self.batch)+1)*(batch_len+1)**2>self.batch_cells:
+            self.flush()
+            batch_len=len(heads)
+        self.batch.append(heads)
+        self.batch_len=batch_len
+
+    def add_hist(self,name,values):
+        counts=numpy.bincount(values)
+        old=self.hists.get(name)
+        if old is not None:
+            if len(old)<len(counts):
+                old,counts=counts,old
+            old[:len(counts)]+=counts
+            counts=old
+        self.hists[name]=counts
+
+    def flush(self):
+        if not self.batch:
+            return
+        B,L=len(self.batch),self.batch_len+1 #position 0 is the root
+        heads=numpy.zeros((B,L),dtype=numpy.int64)
+        lengths=numpy.array([len(h) for h in self.batch],dtype=numpy.int64)
+        for b,h in enumerate(self.batch):
+            heads[b,1:len(h)+1]=h
+        self.batch=[]
+        self.batch_len=0
+        ids=numpy.arange(L)
+        rows=numpy.arange(B)[:,None]
+        words=(ids[None,:]>=1)&(ids[None,:]<=lengths[:,None])
+        attached=words&(heads!=0)
+        self.add_hist("sentence_length",lengths)
+        self.add_hist("dependency_length",numpy.abs(ids[None,:]-heads)[attached])
+        children=numpy.zeros((B,L),dtype=numpy.int64)
+        numpy.add.at(children,(numpy.broadcast_to(rows,(B,L))[attached],heads[attached]),1)
+        self.add_hist("branching_factor",children[words])
+        #Walk all nodes up to the root at once, recording depths and the dominance relation
+        #dominated[b,a,k] is True if a is k itself or an ancestor of k in sentence b
+        dominated=numpy.zeros((B,L,L),dtype=bool)
+        depth=numpy.zeros((B,L),dtype=numpy.int64)
+        cur=numpy.broadcast_to(ids,(B,L)).copy()
+        alive=words.copy()
+        for _ in range(L): #no path is longer than L, unless there is a cycle
+            if not alive.any():
+                break
+            b_idx,k_idx=numpy.nonzero(alive)
+            dominated[b_idx,cur[alive],k_idx]=True
+            cur=numpy.where(alive,heads[rows,cur],0)
+            depth+=alive
+            alive&=cur!=0
+        dominated[:,0,:]=True
+        self.add_hist("tree_depth",numpy.where(words,depth,0).max(axis=1))
+        #Arc h->d is non-projective if some word between h and d is not dominated by h
+        lo=numpy.minimum(heads,ids[None,:])[:,:,None]
+        hi=numpy.maximum(heads,ids[None,:])[:,:,None]
+        between=(ids[None,None,:]>lo)&(ids[None,None,:]<hi)
+        nonproj=(between&~dominated[rows,heads]).any(axis=2)&words
+        self.tree_count+=B
+        self.arc_count+=int(lengths.sum())
+        self.nonproj_arc_count+=int(nonproj.sum())
+        self.nonproj_tree_count+=int(nonproj.any(axis=1).sum())
+
+    def get_stats(self):
+        """Returns a dictionary of the shape stats, histograms map value -> count"""
+        self.flush()
+        d={"tree_count":self.tree_count,"arc_count":self.arc_count,
+           "nonprojective_arc_count":self.nonproj_arc_count,"nonprojective_tree_count":self.nonproj_tree_count,
+           "nonprojective_arc_rate":float(self.nonproj_arc_count)/self.arc_count if self.arc_count else 0.0}
+        for name,counts in self.hists.items():
+            d[name]=dict((str(v),int(c)) for v,c in enumerate(counts) if c)
+        return d
+
 class Stats(object):
 
     def __init__(self):
@@ -47,18 +358,18 @@ class Stats(object):
                 self.deprel_counter[deprel]=self.deprel_counter.get(deprel,0)+1
     
     def print_basic_stats(self,out):
-        print >> out, "Tree count: ", self.tree_count
-        print >> out, "Word count: ", self.word_count
-        print >> out, "Token count:", self.token_count
-        langspec=sum(1 for deprel in self.deprel_counter.iterkeys() if u":" in deprel)
-        print >> out, "Dep. relations: %d of which %d language specific"%(len(self.deprel_counter),langspec)
-        print >> out, "POS tags:",sum(1 for cat_is_val in self.f_val_counter if cat_is_val.startswith(u"CPOSTAG="))
-        print >> out, "Category=value feature pairs:",sum(1 for cat_is_val in self.f_val_counter if not cat_is_val.startswith(u"CPOSTAG="))
+        print("Tree count: ", self.tree_count, file=out)
+        print("Word count: ", self.word_count, file=out)
+        print("Token count:", self.token_count, file=out)
+        langspec=sum(1 for deprel in self.deprel_counter if u":" in deprel)
+        print("Dep. relations: %d of which %d language specific"%(len(self.deprel_counter),langspec), file=out)
+        print("POS tags:",sum(1 for cat_is_val in self.f_val_counter if cat_is_val.startswith(u"CPOSTAG=")), file=out)
+        print("Category=value feature pairs:",sum(1 for cat_is_val in self.f_val_counter if not cat_is_val.startswith(u"CPOSTAG=")), file=out)
 
     def get_stats(self):
         """Returns a dictionary of elementary stats"""
-        langspec=sum(1 for deprel in self.deprel_counter.iterkeys() if u":" in deprel)
-        ud_rels=len(set(deprel.split(u":")[0] for deprel in self.deprel_counter.iterkeys()))
+        langspec=sum(1 for deprel in self.deprel_counter if u":" in deprel)
+        ud_rels=len(set(deprel.split(u":")[0] for deprel in self.deprel_counter))
         d={"tree_count":self.tree_count,"word_count":self.word_count,"token_count":self.token_count,"deprels":len(self.deprel_counter),"langspec_deprels":langspec, "universal_deprels":ud_rels, "postags":sum(1 for cat_is_val in self.f_val_counter if cat_is_val.startswith(u"CPOSTAG=")),"catvals":sum(1 for cat_is_val in self.f_val_counter if not cat_is_val.startswith(u"CPOSTAG=")),"words_with_lemma_count":self.words_with_lemma_count,"words_with_deps_count":self.words_with_deps_count}
         return d
         
@@ -71,13 +382,13 @@ class Stats(object):
         elif sort=="alph":
             key=lambda x:x[0].lower()
         else:
-            print >> sys.stderr, "Unknown sort order: %s. Use --sort=freq or --sort=alph."
+            print("Unknown sort order: %s. Use --sort=freq or --sort=alph.", file=sys.stderr)
             sys.exit(1)
-        for deprel,count in sorted(self.deprel_counter.iteritems(),key=key):
+        for deprel,count in sorted(self.deprel_counter.items(),key=key):
             if u":" in deprel and u"langspec" in which:
-                print >> out, deprel
+                print(deprel, file=out)
             if u":" not in deprel and u"UD" in which:
-                print >> out, deprel
+                print(deprel, file=out)
 
     def print_features(self,out,which=u"UD+langspec",sort="freq"):
         #1) get UD features
@@ -93,12 +404,12 @@ class Stats(object):
         elif sort=="alph":
             key=lambda x:x[0].lower()
         else:
-            print >> sys.stderr, "Unknown sort order: %s. Use --sort=freq or --sort=alph."
+            print("Unknown sort order: %s. Use --sort=freq or --sort=alph.", file=sys.stderr)
             sys.exit(1)
-        for cat_is_val,count in sorted(self.f_val_counter.iteritems(),key=key):
+        for cat_is_val,count in sorted(self.f_val_counter.items(),key=key):
             cat,val=cat_is_val.split(u"=",1)
             if not cat==u"CPOSTAG" and ((u"UD" in which and cat in ud_cats) or (u"langspec" in which and cat not in ud_cats)):
-                print >> out, cat_is_val
+                print(cat_is_val, file=out)
         
         
 
@@ -110,30 +421,57 @@ if __name__=="__main__":
     opt_parser.add_argument('--deprels',default=None,help='Print deprels. The option can be "UD", "langspec", or "UD+langspec".')
     opt_parser.add_argument('--catvals',default=None,help='Print category=value pairs. The option can be "UD", "langspec", or "UD+langspec". This distinction is based on the feature, not the value.')
     opt_parser.add_argument('--sort',default='freq',help='Sort the values by their frequency (freq) or alphabetically (alph). Default: %(default)s.')
+    opt_parser.add_argument('--shape-stats',action='store_true',default=False, help='Print dependency length, tree depth, branching factor and sentence length histograms and non-projectivity rates as json dictionary')
+    opt_parser.add_argument('--sketches',action='store_true',default=False, help='Also collect approximate vocabulary sizes, top-K forms/lemmas and sample sentences per deprel in bounded memory. Requires --jsonstats, whose output reports them.')
+    opt_parser.add_argument('--topk',type=int,default=20,help='Number of most frequent forms/lemmas reported by --sketches. Default: %(default)d.')
+    opt_parser.add_argument('--hll-precision',type=int,default=14,help='HyperLogLog uses 2**N registers for the distinct counts of --sketches. Default: %(default)d.')
+    opt_parser.add_argument('--reservoir-size',type=int,default=5,help='Number of sample sentences per deprel kept by --sketches. Default: %(default)d.')
+    opt_parser.add_argument('--columnar',default=None,metavar='DIR',help='Also save per-token columns of integer codes (ID kind, UPOS, deprel, feature bitsets, head offset, sentence index) as NumPy .npy files with their vocab.json into DIR.')
     args = opt_parser.parse_args() #Parsed command-line arguments
     args.output="-"
+    if args.sketches and not args.jsonstats:
+        opt_parser.error("--sketches is reported in the --jsonstats output, use it with --jsonstats.")
+    if (args.columnar or args.shape_stats) and numpy is None:
+        print("--columnar and --shape-stats need NumPy. Install it using 'pip install numpy'.", file=sys.stderr)
+        sys.exit(1)
     inp,out=file_util.in_out(args,multiple_files=True)
     trees=file_util.trees(inp)
 
     stats=Stats()
+    sketches=SketchStats(args.topk,args.hll_precision,args.reservoir_size) if args.sketches else None
+    columnar=ColumnarWriter(args.columnar) if args.columnar else None
+    shape=ShapeStats() if args.shape_stats else None
     try:
         for comments,tree in trees:
             stats.tree_count+=1
             for cols in tree:
                 stats.count_cols(cols)
+            if sketches is not None:
+                sketches.count_tree(comments,tree)
+            if columnar is not None:
+                columnar.add_tree(tree)
+            if shape is not None:
+                shape.add_tree(tree)
     except:
         traceback.print_exc()
-        print >> sys.stderr, "\n\n ------- STATS MAY BE EMPTY OR INCOMPLETE ----------"
+        print("\n\n ------- STATS MAY BE EMPTY OR INCOMPLETE ----------", file=sys.stderr)
         pass
+    if columnar is not None:
+        columnar.save()
     if args.stats:
         stats.print_basic_stats(out)
     if args.jsonstats:
         d=stats.get_stats()
-        print json.dumps(d)
+        if sketches is not None:
+            d["sketches"]=sketches.get_stats()
+        print(json.dumps(d), file=out)
+    if shape is not None:
+        print(json.dumps(shape.get_stats()), file=out)
     if args.deprels:
         stats.print_deprels(out,args.deprels,args.sort)
     if args.catvals:
         stats.print_features(out,args.catvals,args.sort)
+    out.close()
 
     
 
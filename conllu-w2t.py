@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 import sys
 import re
@@ -6,13 +6,15 @@ import file_util
 from file_util import ID,HEAD,DEPS #column index for the columns we'll need
 import argparse
 
-interval_re=re.compile(ur"^([0-9]+)-([0-9]+)$",re.U)
+interval_re=re.compile(r"^([0-9]+)-([0-9]+)$",re.U)
 def get_tokens(wtree):
     """
     Returns a list of tokens in the tree as integer intervals like so:
     [(1,1),(2,3),(4,4),...]
 
-    `tree` is a tree (as produced by trees()) in the word-indexed format
+    `wtree` is a tree (as produced by trees()) in the word-indexed format.
+    Empty nodes raise a ValueError: their N.M ids would collide with the ids of
+    the words of multiword tokens in the token-indexed format.
     """
     tokens=[]
     for cols in wtree:
@@ -23,48 +25,205 @@ def get_tokens(wtree):
                 tokens.append((t_id,t_id)) #nope - let's make a default interval for it
         else:
             match=interval_re.match(cols[ID]) #Check the interval against the regex
+            if not match:
+                raise ValueError("Cannot convert the line with ID %s, only words and multiword tokens are supported."%cols[ID])
             beg,end=int(match.group(1)),int(match.group(2))
             tokens.append((beg,end))
     return tokens
 
+_id_strs=[] #_id_strs[i] is the interned str(i)
+_sub_id_strs={} #key: (token,word) value: the interned "token.word"
+
+def id_str(i):
+    while len(_id_strs)<=i:
+        _id_strs.append(sys.intern(str(len(_id_strs))))
+    return _id_strs[i]
+
+def sub_id_str(token,word):
+    s=_sub_id_strs.get((token,word))
+    if s is None:
+        s=_sub_id_strs[(token,word)]=sys.intern("%d.%d"%(token,word))
+    return s
+
+def range_str(b,e):
+    return sys.intern("%d-%d"%(b,e))
+
+class IdRemap(object):
+    """
+    ID remapping table of one sentence, built once from either of its numberings
+    and applied to its ID, HEAD and DEPS columns in either direction.
+    word_ids[w] and token_ids[w] are the word-based and token-based ids of the
+    w-th word (1-based, index 0 is the root "0"), word_line_ids[i] and
+    token_line_ids[i] the IDs of line i in both formats. If the sentence has no
+    multiword tokens, `identity` is True and nothing needs to be rewritten.
+    """
+
+    __slots__=("word_ids","token_ids","word_line_ids","token_line_ids","token_index","identity")
+
+    def __init__(self):
+        self.word_ids=[id_str(0)]
+        self.token_ids=[id_str(0)]
+        self.word_line_ids=[]
+        self.token_line_ids=[]
+        self.token_index=None #key: token-based id value: word index, built on demand
+        self.identity=True
+
+    @classmethod
+    def from_words(cls,wtree):
+        """Builds the table of `wtree`, a tree in the word-indexed format"""
+        remap=cls()
+        word=0
+        for token,(b,e) in enumerate(get_tokens(wtree),1): #go over all token ranges and produce new IDs for the words involved
+            remap.token_line_ids.append(id_str(token)) #the token line, or the word itself if token==word
+            if b==e:
+                word+=1
+                remap.word_ids.append(id_str(word))
+                remap.token_ids.append(id_str(token))
+                remap.word_line_ids.append(id_str(word))
+            else:
+                remap.identity=False
+                remap.word_line_ids.append(range_str(b,e))
+                for sub in range(1,e-b+2): #as many lines as there are words in the token
+                    word+=1
+                    remap.word_ids.append(id_str(word))
+                    remap.token_ids.append(sub_id_str(token,sub))
+                    remap.word_line_ids.append(id_str(word))
+                    remap.token_line_ids.append(remap.token_ids[-1])
+        return remap
+
+    @classmethod
+    def from_tokens(cls,ttree):
+        """Builds the table of `ttree`, a tree in the token-indexed format"""
+        remap=cls()
+        word=0
+        i=0
+        while i<len(ttree):
+            t_id=ttree[i][ID]
+            prefix=t_id+u"."
+            j=i+1 #the words of a multiword token follow it as t_id.1, t_id.2, ...
+            while j<len(ttree) and ttree[j][ID].startswith(prefix):
+                j+=1
+            remap.token_line_ids.append(t_id)
+            if j==i+1: #token==word
+                word+=1
+                remap.word_ids.append(id_str(word))
+                remap.token_ids.append(t_id)
+                remap.word_line_ids.append(id_str(word))
+            else:
+                remap.identity=False
+                remap.word_line_ids.append(range_str(word+1,word+j-i-1))
+                for k in range(i+1,j):
+                    word+=1
+                    remap.word_ids.append(id_str(word))
+                    remap.token_ids.append(ttree[k][ID])
+                    remap.word_line_ids.append(id_str(word))
+                    remap.token_line_ids.append(ttree[k][ID])
+            i=j
+        return remap
+
+    def to_tokens(self,wtree):
+        """
+        Returns the rows of `wtree` renumbered into the token-indexed format.
+        Only rows that change are copied, into the same type (list or tuple).
+        """
+        if self.identity:
+            return list(wtree)
+        token_ids=self.token_ids
+        return self.renumber(wtree,self.token_line_ids,lambda head:token_ids[int(head)])
+
+    def to_words(self,ttree):
+        """
+        Returns the rows of `ttree` renumbered into the word-indexed format.
+        Only rows that change are copied, into the same type (list or tuple).
+        """
+        if self.identity:
+            return list(ttree)
+        if self.token_index is None:
+            self.token_index=dict((t_id,word) for word,t_id in enumerate(self.token_ids))
+        word_ids,token_index=self.word_ids,self.token_index
+        return self.renumber(ttree,self.word_line_ids,lambda head:word_ids[token_index[head]])
+
+    def renumber(self,tree,line_ids,new_head):
+        result=[]
+        for cols,new_id in zip(tree,line_ids):
+            head=deps=cols[HEAD]
+            if head!=u"_": #not a token
+                head=new_head(head)
+                deps=cols[DEPS]
+                if deps!=u"_": #need to renumber secondary deps
+                    deps=self.renumber_deps(deps,new_head)
+            if new_id==cols[ID] and head==cols[HEAD] and deps is cols[DEPS]:
+                result.append(cols)
+                continue
+            new_cols=list(cols)
+            new_cols[ID]=new_id
+            new_cols[HEAD]=head
+            new_cols[DEPS]=deps
+            result.append(new_cols if isinstance(cols,list) else tuple(new_cols))
+        return result
+
+    def renumber_deps(self,deps,new_head):
+        """Returns `deps` with the heads renumbered, the same object if none changes"""
+        pairs=deps.split(u"|")
+        changed=False
+        for i,head_deprel in enumerate(pairs):
+            head,deprel=head_deprel.split(u":",1)
+            head2=new_head(head)
+            if head2!=head:
+                pairs[i]=head2+u":"+deprel
+                changed=True
+        return u"|".join(pairs) if changed else deps
+
 def w2t(wtree):
-    tokens=get_tokens(wtree)
-    word_ids=[u"0"] #root remains 0
-    line_idx=0 #index of the line in wtree we are editing
-    for token_idx,(b,e) in enumerate(tokens): #go over all token ranges and produce new IDs for the words involved
-        wtree[line_idx][ID]=unicode(token_idx+1) #Renumber the ID field of the token
-        if b==e: #token==word
-            word_ids.append("%d"%(token_idx+1))
-            line_idx+=1
-        else:
-            #We have a range, renumber the words
-            line_idx+=1
-            for word_idx,_ in enumerate(range(b,e+1)): #consume as many lines as there are words in the token
-                word_ids.append("%d.%d"%(token_idx+1,word_idx+1))
-                wtree[line_idx][ID]=word_ids[-1]
-                line_idx+=1
-    #word_ids is now a list with 1-based indexing which has the new ID for every single word
-    #the ID column has been renumbered by now
-    #now we can renumber all of the HEAD columns
-    for cols in wtree:
-        if cols[HEAD]==u"_": #token
-            continue
-        cols[HEAD]=word_ids[int(cols[HEAD])]
-        if cols[DEPS]!=u"_": #need to renumber secondary deps
-            new_pairs=[]
-            for head_deprel in cols[DEPS].split(u"|"):
-                head,deprel=head_deprel.split(u":")
-                new_pairs.append(word_ids[int(head)]+u":"+deprel)
-            cols[DEPS]=u"|".join(new_pairs)
+    """
+    Renumbers `wtree`, a list of rows of columns in the word-indexed format,
+    in place into the token-indexed format.
+    """
+    wtree[:]=IdRemap.from_words(wtree).to_tokens(wtree)
+
+def t2w(ttree):
+    """
+    Renumbers `ttree`, a list of rows of columns in the token-indexed format
+    as produced by w2t(), in place back into the word-indexed format.
+    """
+    ttree[:]=IdRemap.from_tokens(ttree).to_words(ttree)
+
+def w2t_chunk(trees):
+    """
+    Converts a list of (comments,tree) pairs, returns the CoNLL-U text of the
+    converted trees. This is the unit of work of the parallel conversion.
+    """
+    result=[]
+    for comments,tree in trees:
+        tree=IdRemap.from_words(tree).to_tokens(tree)
+        result.append(file_util.format_tree(comments,tree))
+    return "".join(result)
+
+def t2w_chunk(trees):
+    """Like w2t_chunk(), for the --reverse conversion"""
+    result=[]
+    for comments,tree in trees:
+        tree=IdRemap.from_tokens(tree).to_words(tree)
+        result.append(file_util.format_tree(comments,tree))
+    return "".join(result)
 
 if __name__=="__main__":
-    opt_parser = argparse.ArgumentParser(description='Conversion script from word-based CoNLL-U to token-based CoNLL-U. This script assumes that the input is validated and does no checking on its own.')
+    opt_parser = argparse.ArgumentParser(description='Conversion script from word-based CoNLL-U to token-based CoNLL-U and back. This script assumes that the input is validated and does no checking on its own.')
     opt_parser.add_argument('input', nargs='?', help='Input file name, or "-" or nothing for standard input.')
     opt_parser.add_argument('output', nargs='?', help='Output file name, or "-" or nothing for standard output.')
+    opt_parser.add_argument('--reverse', action='store_true', default=False, help='Convert token-based CoNLL-U, as produced by this script, back to word-based CoNLL-U.')
+    opt_parser.add_argument('-j','--jobs', type=int, default=1, help='Number of worker processes converting the sentences. Default: %(default)d.')
+    opt_parser.add_argument('--chunk-size', type=int, default=500, help='Number of sentences sent to a worker at a time. Default: %(default)d.')
     args = opt_parser.parse_args() #Parsed command-line arguments
 
     inp,out=file_util.in_out(args)
-    for comments,tree in file_util.trees(inp):
-        w2t(tree)
-        file_util.print_tree(comments,tree,out)
+    try:
+        convert_chunk=t2w_chunk if args.reverse else w2t_chunk
+        for text in file_util.ordered_map(convert_chunk,file_util.trees(inp),args.jobs,args.chunk_size):
+            out.write(text)
+    except ValueError as e: #file_util.ConlluFormatError or an empty node
+        print("%s Giving up."%e,file=sys.stderr)
+        sys.exit(1)
+    finally:
+        out.close()
 
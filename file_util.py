@@ -3,77 +3,305 @@ A module with a handful of utility functions for dealing with
 file I/O
 """
 
-import codecs
+import os
+import re
 import sys
 import io
-import os
-import fileinput
+import collections
 
 COLCOUNT=10
 ID,FORM,LEMMA,CPOSTAG,POSTAG,FEATS,HEAD,DEPREL,DEPS,MISC=range(COLCOUNT)
-COLNAMES=u"ID,FORM,LEMMA,CPOSTAG,POSTAG,FEATS,HEAD,DEPREL,DEPS,MISC".split(u",")
+COLNAMES="ID,FORM,LEMMA,CPOSTAG,POSTAG,FEATS,HEAD,DEPREL,DEPS,MISC".split(",")
+
+BLOCK_SIZE=1<<20 #Input is read and decoded this many bytes at a time
+INDEX_SUFFIX=".idx" #Sentence index of file.conllu is stored in file.conllu.idx
+
+class ConlluFormatError(ValueError):
+    """Raised by trees() on input which is not CoNLL-U, unless an error callback is given"""
+
+    def __init__(self,line_no,msg):
+        ValueError.__init__(self,"Line %d: %s"%(line_no,msg))
+        self.line_no=line_no
+        self.msg=msg
+
+class ChainedInput(object):
+    """Binary file-like object reading several files one after another"""
+
+    def __init__(self,file_names):
+        self.file_names=list(file_names)
+        self.current=None
+
+    def read(self,size=-1):
+        while True:
+            if self.current is None:
+                if not self.file_names:
+                    return b""
+                self.current=open(self.file_names.pop(0),"rb")
+            data=self.current.read(size)
+            if data:
+                return data
+            self.current.close()
+            self.current=None
+
+class TreeWriter(object):
+    """Text output to a binary stream. Whole trees (or any text) are collected
+    in a buffer which is encoded and written with a single write once it holds
+    `buffer_size` characters, and on flush() or close().
+    """
+
+    def __init__(self,out,buffer_size=BLOCK_SIZE,closefd=True):
+        self.out=out
+        self.buffer_size=buffer_size
+        self.closefd=closefd
+        self.buffer=[]
+        self.size=0
 
+    def write(self,text):
+        self.buffer.append(text)
+        self.size+=len(text)
+        if self.size>=self.buffer_size:
+            self.flush()
+
+    def write_tree(self,comments,tree):
+        self.write(format_tree(comments,tree))
+
+    def write_bytes(self,data):
+        """Writes already encoded data, after any text still in the buffer"""
+        self.flush()
+        self.out.write(data)
+
+    def flush(self):
+        if self.buffer:
+            self.out.write("".join(self.buffer).encode("utf-8"))
+            self.buffer=[]
+            self.size=0
+        self.out.flush()
+
+    def close(self):
+        self.flush()
+        if self.closefd:
+            self.out.close()
 
 def in_out(args,multiple_files=False):
-    """Open the input/output data streams. If multiple_files is set to
-    True, returns an iterator over lines. If set to False, returns an open file.
-    This distinction is needed because validator.py checks the newlines property and
-    needs to get the input as a file, but the other scripts just need the lines
-    so they can work with several files.
+    """Open the input/output data streams. The input is a binary file-like
+    object to be given to trees(). If multiple_files is set to True, args.input
+    is a list of file names which are read one after another.
+    The output is a TreeWriter writing UTF-8, it must be closed at the end.
     """
-    #Decide where to get the data from
-    if args.input is None or args.input=="-": #Stdin
-        inp=codecs.getreader("utf-8")(os.fdopen(0,"U")) #Switched universal newlines on
-    else: #File name given
-        if multiple_files:
-            inp_raw=fileinput.input(files=args.input,mode="U")
-            inp=(line.decode("utf-8") for line in inp_raw)
-        else:
-            inp_raw=open(args.input,mode="U")
-            inp=codecs.getreader("utf-8")(inp_raw)
-    #inp is now an iterator over lines, giving unicode strings
-
-    if args.output is None or args.output=="-": #stdout
-        out=codecs.getwriter("utf-8")(sys.stdout)
-    else: #File name given
-        out=codecs.open(args.output,"w","utf-8")
-    return inp,out
+    if multiple_files and args.input not in (None,"-",["-"],[]):
+        return ChainedInput(args.input),open_output(args.output)
+    return open_input(args.input),open_output(args.output)
 
-def print_tree(comments,tree,out):
+def open_input(name):
+    """Opens file `name` for reading in binary mode, stdin for "-" or None"""
+    if name is None or name=="-" or name==["-"] or name==[]: #Stdin
+        return sys.stdin.buffer
+    return open(name,"rb")
+
+def open_output(name):
+    """Returns a TreeWriter writing to file `name`, or to stdout for "-" or None"""
+    if name is None or name=="-": #stdout
+        return TreeWriter(sys.stdout.buffer,closefd=False)
+    return TreeWriter(open(name,"wb"))
+
+def format_tree(comments,tree):
+    """Returns the tree as CoNLL-U text, including the empty line after it"""
+    rows=["\t".join(cols) for cols in tree]
     if comments:
-        print >> out, u"\n".join(comments)
-    for cols in tree:
-        print >> out, u"\t".join(cols)
-    print >> out
+        rows[0:0]=comments
+    rows.append("\n")
+    return "\n".join(rows)
 
-def trees(inp):
+def print_tree(comments,tree,out):
+    out.write(format_tree(comments,tree))
+
+def lines(inp,block_size=BLOCK_SIZE):
     """
-    `inp` a file-like object yielding lines as unicode
-    
-    Yields the input a tree at a time.
+    `inp` a binary file-like object
+
+    Yields the lines of the input as unicode strings, without the newline.
+    The input is read and decoded block by block, a line is never split
+    across blocks.
+    """
+    rest=b""
+    while True:
+        block=inp.read(block_size)
+        if not block:
+            break
+        end=block.rfind(b"\n")
+        if end<0: #No complete line in this block
+            rest+=block
+            continue
+        text=(rest+block[:end]).decode("utf-8")
+        rest=block[end+1:]
+        for line in text.split("\n"): #not "yield from", validate-python2-obsolete.py imports this module
+            yield line
+    if rest:
+        yield rest.decode("utf-8")
+
+def trees(inp,on_error=None):
+    """
+    `inp` a binary file-like object
+    `on_error` a function called as on_error(line_no,msg) for lines which are not
+    CoNLL-U. The line is then skipped. If `on_error` is None, ConlluFormatError
+    is raised instead.
+
+    Yields the input a tree at a time, as a (comments,tree) pair where tree is
+    a list of tuples of columns.
     """
     comments=[] #List of comment lines to go with the current tree
-    lines=[] #List of token/word lines of the current tree
-    for line_counter, line in enumerate(inp):
+    tree=[] #List of token/word lines of the current tree
+    for line_counter,line in enumerate(lines(inp)):
         line=line.rstrip()
         if not line: #empty line
-            if lines: #Sentence done, yield. Skip otherwise.
-                yield comments, lines
+            if tree: #Sentence done, yield. Skip otherwise.
+                yield comments,tree
                 comments=[]
-                lines=[]
-        elif line[0]==u"#":
+                tree=[]
+        elif line[0]=="#":
             comments.append(line)
         elif line[0].isdigit():
-            cols=line.split(u"\t")
+            cols=tuple(line.split("\t"))
             if len(cols)!=COLCOUNT:
-                print >> sys.stderr, u"Line %d: The line has %d columns, but %d are expected. Giving up."%(line_counter+1,len(cols),COLCOUNT)
-                sys.exit(1)
-            lines.append(cols)
+                msg="The line has %d columns, but %d are expected."%(len(cols),COLCOUNT)
+                if on_error is None:
+                    raise ConlluFormatError(line_counter+1,msg)
+                on_error(line_counter+1,msg)
+                continue
+            tree.append(cols)
         else: #A line which is not a comment, nor a token/word, nor empty. That's bad!
-            #TODO warn!
-            print >> sys.stderr, u"Line %d not conllu: Giving up."%(line_counter+1)
-            sys.exit(1) #Give a non-zero exit code
-    else: #end of file
-        if comments or lines: #Looks like a forgotten empty line at the end of the file, well, okay...
-            yield comments, lines
+            if on_error is None:
+                raise ConlluFormatError(line_counter+1,"Line not conllu.")
+            on_error(line_counter+1,"Line not conllu.")
+    if comments or tree: #Looks like a forgotten empty line at the end of the file, well, okay...
+        yield comments,tree
+
+def chunks(items,size):
+    """Yields lists of `size` consecutive items, the last one may be shorter"""
+    chunk=[]
+    for item in items:
+        chunk.append(item)
+        if len(chunk)>=size:
+            yield chunk
+            chunk=[]
+    if chunk:
+        yield chunk
+
+def ordered_map(func,items,jobs=1,chunk_size=500,window=None,initializer=None,initargs=()):
+    """
+    Yields func(chunk) for the consecutive chunks of `chunk_size` items, in the
+    input order. With jobs>1 the chunks are processed in a pool of `jobs`
+    processes while the input is being read and the results written. At most
+    `window` (default 2*jobs) chunks are in flight, so memory use stays bounded.
+    `func` must be a module-level function so that it can be pickled.
+    `initializer(*initargs)` is called once in every worker process, e.g. to
+    hand the workers state which the caller set up after importing `func`.
+    """
+    if jobs<=1:
+        for chunk in chunks(items,chunk_size):
+            yield func(chunk)
+        return
+    import concurrent.futures #here, as Python 2 (validate-python2-obsolete.py) has no concurrent.futures
+    window=window or 2*jobs
+    with concurrent.futures.ProcessPoolExecutor(jobs,initializer=initializer,initargs=initargs) as pool:
+        pending=collections.deque()
+        for chunk in chunks(items,chunk_size):
+            if len(pending)>=window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(func,chunk))
+        while pending:
+            yield pending.popleft().result()
+
+sentid_re=re.compile(br"^# sent_id\s*=\s*(\S+)$")
+class SentenceIndex(object):
+    """
+    Byte offset and line number of every sentence of a CoNLL-U file, for
+    random access by ordinal (1-based) or sent_id. The index is stored next
+    to the file and rebuilt in one streaming pass whenever the size or the
+    modification time of the file no longer match.
+    """
+
+    def __init__(self,f_name):
+        self.f_name=f_name
+        st=os.stat(f_name)
+        self.stamp="%d\t%d"%(st.st_size,st.st_mtime_ns)
+        if not self.load():
+            self.build()
+            self.save()
+        self.by_id=dict((sent_id,i+1) for i,sent_id in enumerate(self.sent_ids) if sent_id)
+
+    def load(self):
+        try:
+            with open(self.f_name+INDEX_SUFFIX,"r",encoding="utf-8") as f:
+                if f.readline().rstrip("\n")!="# conllu-index\t"+self.stamp:
+                    return False
+                rows=[line.rstrip("\n").split("\t") for line in f]
+            self.offsets=[int(r[0]) for r in rows]
+            self.line_nos=[int(r[1]) for r in rows]
+            self.sent_ids=[r[2] for r in rows]
+        except (OSError,ValueError,IndexError): #missing, stale or corrupt, rebuilt by the caller
+            return False
+        return True
+
+    def build(self):
+        self.offsets=[]
+        self.line_nos=[]
+        self.sent_ids=[] #"" if the sentence has no sent_id
+        offset=0
+        in_sentence=False
+        with open(self.f_name,"rb") as f:
+            for line_no,line in enumerate(f,1):
+                if line.strip():
+                    if not in_sentence:
+                        self.offsets.append(offset)
+                        self.line_nos.append(line_no)
+                        self.sent_ids.append("")
+                        in_sentence=True
+                    if not self.sent_ids[-1] and line.startswith(b"#"):
+                        match=sentid_re.match(line.rstrip(b"\r\n"))
+                        if match:
+                            self.sent_ids[-1]=match.group(1).decode("utf-8")
+                else:
+                    in_sentence=False
+                offset+=len(line)
+
+    def save(self):
+        try:
+            with open(self.f_name+INDEX_SUFFIX,"w",encoding="utf-8") as f:
+                f.write("# conllu-index\t"+self.stamp+"\n")
+                for row in zip(self.offsets,self.line_nos,self.sent_ids):
+                    f.write("%d\t%d\t%s\n"%row)
+        except OSError: #e.g. a read-only directory, the index just is not kept
+            pass
 
+    def __len__(self):
+        return len(self.offsets)
+
+    def ordinal(self,sent_id):
+        """The ordinal of the sentence with `sent_id`, KeyError if there is none"""
+        return self.by_id[sent_id]
+
+    def read(self,ordinal):
+        """Returns (line number, raw bytes) of sentence `ordinal`, including the empty line after it"""
+        if not 1<=ordinal<=len(self.offsets):
+            raise IndexError("%s has no sentence number %d"%(self.f_name,ordinal))
+        data=[]
+        with open(self.f_name,"rb") as f:
+            f.seek(self.offsets[ordinal-1])
+            for line in f:
+                data.append(line)
+                if not line.strip():
+                    break
+        return self.line_nos[ordinal-1],b"".join(data)
+
+def select_trees(f_name,ordinals=(),sent_ids=(),on_error=None):
+    """
+    Yields the (comments,tree) pairs of the sentences of file `f_name` given by
+    their ordinals (1-based) and sent_ids, in file order, using its SentenceIndex.
+    """
+    index=SentenceIndex(f_name)
+    selected=set(ordinals)|set(index.ordinal(sent_id) for sent_id in sent_ids)
+    for ordinal in sorted(selected):
+        _,data=index.read(ordinal)
+        for tree in trees(io.BytesIO(data),on_error):
+            yield tree
@@ -0,0 +1,45 @@
+"""
+ISO 639 language code lookups, from the ISO 639-3 code table of sil.org
+(http://www-01.sil.org/iso639-3/iso-639-3.tab) stored in data/iso-639-3.tab.
+The table is read on the first lookup, not on import.
+Runs both in Python 2 and 3.
+"""
+
+import io
+import os
+
+THISDIR=os.path.dirname(os.path.abspath(__file__)) #The directory where this script resides
+TABLE=os.path.join(THISDIR,"data","iso-639-3.tab")
+
+_c2to3=None #{ en -> eng }
+_c3_to_name=None #{ eng -> English }
+
+def _load():
+    global _c2to3, _c3_to_name
+    c2to3={}
+    c3_to_name={}
+    with io.open(TABLE,"r",encoding="utf-8") as f:
+        next(f) #header
+        for line in f:
+            c3,_,_,c2,_,_,lname,_=line.rstrip(u"\r\n").split(u"\t")
+            if c2:
+                assert c2 not in c2to3
+                c2to3[c2]=c3
+            c3_to_name[c3]=lname
+    _c2to3,_c3_to_name=c2to3,c3_to_name
+
+def to_iso3(code):
+    """The ISO 639-3 code of a 2-letter ISO 639-1 code, 3-letter codes are returned as they are. KeyError for unknown 2-letter codes."""
+    if len(code)!=2:
+        return code
+    if _c2to3 is None:
+        _load()
+    return _c2to3[code]
+
+def language_name(code):
+    """The reference name of the language with ISO 639-3 (or 639-1) code `code`, None if the code is not in the table"""
+    if _c3_to_name is None:
+        _load()
+    if len(code)==2:
+        code=_c2to3.get(code)
+    return _c3_to_name.get(code)
@@ -1,7 +1,6 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 import os
-import codecs
 import argparse
 import file_util
 import sys
@@ -9,18 +8,22 @@ import re
 
 ID,FORM=0,1
 
+def sent_text(lines):
+    """The words of the sentence separated by a space, sentences with the same text overlap"""
+    return u" ".join(line[FORM] for line in lines if line[ID].isdigit())
+
 def sent_set(inp):
     sents={} #key: sentence text value: count
     for comment,lines in file_util.trees(inp):
-        txt=u" ".join(line[FORM] for line in lines if line[ID].isdigit())
+        txt=sent_text(lines)
         sents[txt]=sents.get(txt,0)+1
     return sents
 
 def overlap(s1,s2):
-    o=set(s1.iterkeys())&set(s2.iterkeys())
-    print "Overlap: ",len(o)
+    o=set(s1)&set(s2)
+    print("Overlap: ",len(o))
     for s in sorted(o):
-        print >> sys.stderr, u"   ",s.encode("utf-8")
+        print(u"   ",s,file=sys.stderr)
     return len(o)
 
 fname_re=re.compile(r"([a-z_]+)-ud-(dev|test|train(-[a-z])?)\.conllu")
@@ -50,21 +53,21 @@ if __name__=="__main__":
     opt_parser.add_argument('input', nargs='+', help='Input file names to cross-check.')
     
     args = opt_parser.parse_args() #Parsed command-line arguments
-    print "Input:", " ".join(args.input)
+    print("Input:", " ".join(args.input))
     
     sents=[] 
     names=[]
     for f_name in args.input:
         if not os.path.exists(f_name):
             continue
-        with codecs.open(f_name,"r","utf-8") as f:
+        with open(f_name,"rb") as f:
             sents.append(sent_set(f))
             names.append(f_name)
     for i1,i2 in get_test_pairs(args,names):
-        print "-"*25
-        print "S1:", names[i1]
-        print "S2:", names[i2]
-        print
+        print("-"*25)
+        print("S1:", names[i1])
+        print("S2:", names[i2])
+        print()
         overlap(sents[i1],sents[i2])
 
             
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+The checks done before publishing a release, in a single pass over every
+treebank file. For every UD_* repository of the release directory the metadata
+is checked as by validate_repo_metadata.py, and every .conllu file is read once,
+its sentences going at the same time to the validator (validate.py), the basic
+statistics (conllu-stats.py) and the overlap check between train, dev and test
+(overlap.py). The repositories are checked in parallel processes and the
+results are written as one JSON report.
+"""
+
+import os
+import io
+import sys
+import json
+import typing
+import argparse
+import functools
+import traceback
+import importlib.util
+import concurrent.futures
+
+import validate
+import validate_repo_metadata
+import overlap
+
+THISDIR=os.path.dirname(os.path.abspath(__file__))
+
+def load_script(name,f_name):
+    """Imports the script `f_name` of this directory, whose file name is not a valid module name, as module `name`"""
+    spec=importlib.util.spec_from_file_location(name,os.path.join(THISDIR,f_name))
+    module=importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+conllu_stats=load_script("conllu_stats","conllu-stats.py")
+
+def file_lang(f_name):
+    """The language code of a file named by the UD convention (en_ewt-ud-train.conllu -> en), None for other names"""
+    match=overlap.fname_re.match(os.path.basename(f_name))
+    if not match:
+        return None
+    return match.group(1).split("_")[0]
+
+@functools.lru_cache(maxsize=None)
+def load_tagsets(lang):
+    """The validator's tag sets of language `lang`, loaded once per process"""
+    return validate.load_tagsets(lang)
+
+def check_file(f_name,validate_args,tagsets,known_sent_ids,max_diagnostics=20):
+    """
+    Validates file `f_name`, collecting its stats and sentence texts from the
+    sentences the validator reads. Returns (report dictionary, {sentence text: count}).
+    The report lists the first `max_diagnostics` errors as validate.py --format jsonl
+    records, the error counts include all of them.
+    """
+    stats=conllu_stats.Stats()
+    texts={}
+    report={"errors":{},"diagnostics":[],"stats_complete":True}
+
+    def record_observer(record):
+        if len(report["diagnostics"])<max_diagnostics:
+            report["diagnostics"].append(record)
+
+    def observer(comments,sentence):
+        stats.tree_count+=1
+        try:
+            for cols in sentence:
+                stats.count_cols(cols)
+            txt=overlap.sent_text(sentence)
+            texts[txt]=texts.get(txt,0)+1
+        except (ValueError,IndexError): #malformed lines, reported by the validator
+            report["stats_complete"]=False
+
+    validate.new_file(f_name)
+    validate.record_observer=record_observer
+    try:
+        with io.open(f_name,"r",encoding="utf-8") as inp:
+            validate.validate(inp,sys.stdout,validate_args,tagsets,known_sent_ids,observer=observer)
+    except Exception:
+        validate.warn("Exception caught!","Format")
+        report["exception"]=traceback.format_exc()
+    finally:
+        validate.record_observer=None
+    report["errors"]=dict(validate.error_counter)
+    report["stats"]=stats.get_stats()
+    return report,texts
+
+def check_repo(repodir,level=5,max_diagnostics=20):
+    """All the checks of one repository, returns its report as a dictionary"""
+    report={"metadata":[],"files":{},"overlap":[]}
+    try:
+        report["metadata"]=[{"test":test,"code":code,"reason":reason} for test,code,reason in validate_repo_metadata.check_repo(repodir)]
+        f_names=sorted(f for f in os.listdir(repodir) if f.endswith(".conllu"))
+    except OSError as e:
+        report["exception"]="Cannot read the repository: %s"%e
+        report["passed"]=False
+        return report
+
+    known_sent_ids=set() #sent_ids must be unique in the whole treebank
+    names=[]
+    texts=[]
+    for f_name in f_names:
+        lang=file_lang(f_name)
+        if lang is None:
+            report["files"][f_name]={"skipped":"The file name does not follow the UD naming convention."}
+            continue
+        validate_args=validate.build_opt_parser().parse_args(["--format","jsonl","--max-err","0","--lang",lang,"--level",str(level),f_name])
+        validate.set_args(validate_args)
+        tagsets=load_tagsets(validate_args.lang)
+        report["files"][f_name],file_texts=check_file(os.path.join(repodir,f_name),validate_args,tagsets,known_sent_ids,max_diagnostics)
+        names.append(f_name)
+        texts.append(file_texts)
+
+    for i1,i2 in overlap.get_test_pairs(argparse.Namespace(raw=False),names):
+        common=set(texts[i1])&set(texts[i2])
+        if common:
+            report["overlap"].append({"files":[names[i1],names[i2]],"count":len(common),"examples":sorted(common)[:5]})
+
+    report["passed"]=not report["metadata"] and not report["overlap"] and all(not r.get("errors") and "exception" not in r for r in report["files"].values())
+    return report
+
+if __name__=="__main__":
+    opt_parser = argparse.ArgumentParser(description='Release gate: checks the metadata, validity and train/dev/test overlap of all the UD repositories of a release, reading every treebank file once, and writes a JSON report. Exits with 0 if all the repositories pass, 1 otherwise.')
+    opt_parser.add_argument('releasedir', help='Directory holding the UD_* repositories.')
+    opt_parser.add_argument('repos', nargs='*', help='Only check these repositories (e.g. UD_Finnish). Default: all.')
+    opt_parser.add_argument('-o','--report', default='-', help='Output file of the JSON report, or "-" for standard output. Default: %(default)s.')
+    opt_parser.add_argument('--level', type=int, default=5, help='Validation level, as in validate.py. Default: %(default)d.')
+    opt_parser.add_argument('--max-diagnostics', type=int, default=20, help='How many errors of each file to list in the report (file, line, sent_id, test and message); all of them are counted. Default: %(default)d.')
+    opt_parser.add_argument('-j','--jobs', type=int, default=os.cpu_count() or 1, help='Number of repositories checked in parallel processes. Default: the number of CPUs.')
+    args = opt_parser.parse_args() #Parsed command-line arguments
+
+    names=args.repos or sorted(d for d in os.listdir(args.releasedir) if d.startswith("UD_") and os.path.isdir(os.path.join(args.releasedir,d)))
+    repodirs=[os.path.join(args.releasedir,name) for name in names]
+    reports: typing.Iterator[typing.Dict[str,typing.Any]]
+    if args.jobs<=1:
+        reports=(check_repo(repodir,args.level,args.max_diagnostics) for repodir in repodirs)
+    else:
+        pool=concurrent.futures.ProcessPoolExecutor(args.jobs)
+        reports=pool.map(check_repo,repodirs,[args.level]*len(repodirs),[args.max_diagnostics]*len(repodirs))
+    results={}
+    for name,report in zip(names,reports):
+        print("%s: %s"%(name,"PASSED" if report["passed"] else "FAILED"),file=sys.stderr)
+        results[name]=report
+    if args.jobs>1:
+        pool.shutdown()
+
+    failed=sorted(name for name,report in results.items() if not report["passed"])
+    report={"repos":results,"passed":len(results)-len(failed),"failed":failed}
+    out=sys.stdout if args.report=="-" else open(args.report,"w",encoding="utf-8")
+    json.dump(report,out,indent=1,sort_keys=True,ensure_ascii=False)
+    out.write("\n")
+    if out is not sys.stdout:
+        out.close()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[0:0]=[ROOT,os.path.join(ROOT,"v2-conversion")]
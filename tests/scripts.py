@@ -0,0 +1,21 @@
+"""
+Helpers shared by the tests: importing the scripts whose file names are not
+valid module names, and small CoNLL-U inputs.
+"""
+
+import os
+import importlib.util
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_script(f_name):
+    """Imports the script `f_name` of the repository root (e.g. conllu-stats.py) as a module"""
+    name=os.path.splitext(f_name)[0].replace("-","_")
+    spec=importlib.util.spec_from_file_location(name,os.path.join(ROOT,f_name))
+    module=importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def rows(text):
+    """The lines of a tree given as text with whitespace separated columns, as tuples of columns"""
+    return [tuple(line.split()) for line in text.strip().split(u"\n")]
@@ -0,0 +1,65 @@
+import io
+import glob
+import os
+
+import pytest
+
+import binary_util
+import file_util
+from scripts import ROOT
+
+def encode(tmp_path,data):
+    f_name=str(tmp_path/"tb.bin")
+    with open(f_name,"wb") as out:
+        binary_util.write_binary(file_util.trees(io.BytesIO(data)),out)
+    return f_name
+
+@pytest.mark.parametrize("f_name",sorted(glob.glob(os.path.join(ROOT,"test-cases","valid","*.conllu"))))
+def test_round_trip(tmp_path,f_name):
+    with open(f_name,"rb") as f:
+        data=f.read()
+    out=io.BytesIO()
+    writer=file_util.TreeWriter(out,closefd=False)
+    with binary_util.BinaryTreebank(encode(tmp_path,data)) as tb:
+        for comments,tree in tb:
+            writer.write_tree(comments,tree)
+        assert len(tb)==len(list(file_util.trees(io.BytesIO(data))))
+    writer.close()
+    expected=io.BytesIO()
+    writer=file_util.TreeWriter(expected,closefd=False)
+    for comments,tree in file_util.trees(io.BytesIO(data)):
+        writer.write_tree(comments,tree)
+    writer.close()
+    assert out.getvalue()==expected.getvalue()
+
+def test_views_outlive_close(tmp_path):
+    data=b"1\ta\t_\t_\t_\t_\t2\tnsubj\t_\t_\n2\tb\t_\t_\t_\t_\t0\troot\t_\t_\n\n"
+    with binary_util.BinaryTreebank(encode(tmp_path,data)) as tb:
+        heads=tb.heads(0)
+        forms=tb.column(0,file_util.FORM)
+        assert tb.string(forms[1])=="b"
+    assert tb.file.closed
+    assert list(heads)==[2,0]
+    heads.release()
+    forms.release()
+    with pytest.raises(ValueError):
+        tb.heads(0)
+
+def opened_files(monkeypatch):
+    files=[]
+    def tracking_open(*args,**kwargs):
+        f=open(*args,**kwargs)
+        files.append(f)
+        return f
+    monkeypatch.setattr(binary_util,"open",tracking_open,raising=False)
+    return files
+
+@pytest.mark.parametrize("data",[b"this is not a binary treebank at all, just some text",b"x",b""])
+def test_bad_file_is_closed(tmp_path,monkeypatch,data):
+    f_name=str(tmp_path/"bad.bin")
+    with open(f_name,"wb") as f:
+        f.write(data)
+    files=opened_files(monkeypatch)
+    with pytest.raises(ValueError):
+        binary_util.BinaryTreebank(f_name)
+    assert len(files)==1 and files[0].closed
@@ -0,0 +1,43 @@
+import os
+import sys
+import json
+import subprocess
+
+import numpy
+
+from scripts import ROOT,load_script,rows
+
+conllu_stats=load_script("conllu-stats.py")
+
+TREE=rows(u"""
+1-2 Ne _ _ _ _ _ _ _ _
+1 N n PART _ Polarity=Neg 2 advmod _ _
+2 e e VERB _ Mood=Ind|Tense=Pres 0 root _ _
+3 x x X _ _ _ _ _ _
+""")
+
+def test_columnar_head_without_number(tmp_path):
+    writer=conllu_stats.ColumnarWriter(str(tmp_path))
+    writer.add_tree(TREE)
+    assert list(writer.head)==[0,1,0,0]
+    writer.save()
+    columns=dict((name,numpy.load(os.path.join(str(tmp_path),name+".npy"))) for name in ("kind","upos","deprel","feats","head","sentence"))
+    assert set(len(column) for column in columns.values())=={4}
+    assert list(columns["kind"])==[1,0,0,0]
+
+def test_shape_stats_head_without_number():
+    shape=conllu_stats.ShapeStats()
+    shape.add_tree(TREE)
+    stats=shape.get_stats()
+    assert stats["tree_count"]==1
+    assert stats["sentence_length"]=={"3":1}
+    assert stats["dependency_length"]=={"1":1}
+
+def test_sketches_need_jsonstats():
+    f_name=os.path.join(ROOT,"test-cases","valid","id_test_part1.conllu")
+    script=os.path.join(ROOT,"conllu-stats.py")
+    result=subprocess.run([sys.executable,script,"--stats","--sketches",f_name],stdout=subprocess.PIPE,stderr=subprocess.PIPE)
+    assert result.returncode==2
+    assert b"--jsonstats" in result.stderr
+    result=subprocess.run([sys.executable,script,"--jsonstats","--sketches",f_name],stdout=subprocess.PIPE,check=True)
+    assert "sketches" in json.loads(result.stdout.decode("utf-8"))
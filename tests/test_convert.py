@@ -0,0 +1,69 @@
+import os
+import sys
+import subprocess
+
+import convert
+from scripts import ROOT
+
+SCRIPT=os.path.join(ROOT,"v2-conversion","convert.py")
+
+DANGLING=u"""# sent_id = dangling
+1\ta\ta\tNOUN\t_\t_\t9\tnmod\t_\t_
+2\tb\tb\tVERB\t_\t_\t0\troot\t_\t_
+
+"""
+
+DOBJ=u"""# sent_id = dobj
+1\tsee\tsee\tVERB\t_\t_\t0\troot\t_\t_
+2\tit\tit\tPRON\t_\t_\t1\tdobj\t_\t_
+
+"""
+OBJ=DOBJ.replace(u"\tdobj\t",u"\tobj\t")
+
+def test_dangling_head_is_copied_unchanged():
+    lines=DANGLING.splitlines(True)[:-1]
+    assert convert.convert_sentence(lines)==DANGLING
+
+def test_dangling_head_does_not_stop_the_run(tmp_path):
+    f_name=str(tmp_path/"in.conllu")
+    with open(f_name,"w",encoding="utf-8") as f:
+        f.write(DANGLING+DOBJ)
+    for jobs in ("1","2"):
+        out=subprocess.run([sys.executable,SCRIPT,"-j",jobs,"--chunk-size","1",f_name],stdout=subprocess.PIPE,stderr=subprocess.PIPE,check=True)
+        assert out.stdout.decode("utf-8")==DANGLING+OBJ
+        assert b"WARNING" in out.stderr
+
+def test_parallel_equals_serial(tmp_path):
+    f_name=str(tmp_path/"in.conllu")
+    with open(f_name,"w",encoding="utf-8") as f:
+        f.write((DOBJ+DANGLING)*200)
+    def run(*opts):
+        log=str(tmp_path/"log")
+        out=subprocess.run([sys.executable,SCRIPT,"--stats","--change-log",log]+list(opts)+[f_name],stdout=subprocess.PIPE,stderr=subprocess.PIPE,check=True)
+        with open(log,"rb") as f:
+            return out.stdout,out.stderr[out.stderr.index(b"step\t"):],f.read() #the warnings of the workers interleave
+    serial=run()
+    assert serial[0].decode("utf-8")==(OBJ+DANGLING)*200
+    assert run("-j","3","--chunk-size","7")==serial
+    assert run("-j","2","--chunk-size","1000")==serial
+
+def test_changes_are_attributed_to_each_processor():
+    text,changes=convert.convert_chunk([(1,DOBJ.splitlines(True)[:-1])],track=True)
+    assert text==OBJ
+    names=[type(processor).__name__ for processor in convert.processors]
+    assert sorted(changes.counts)==list(enumerate(names))
+    assert changes.counts[(2,"RelnRenameUpdateProcessor")]==[0,1,1]
+    assert changes.log==[(1,"dobj","RelnRenameUpdateProcessor",2,"head","1:dobj","1:obj")]
+
+def test_changes_of_all_fields_are_recorded():
+    graph=convert.DependencyGraph(lines=DOBJ.splitlines(True)[:-1])
+    changes=convert.ChangeStats(log=True)
+    before=changes.snapshot(graph)
+    graph.nodes[1].form="saw"
+    graph.nodes[1].lemma="look"
+    graph.nodes[1].pos="VBD"
+    graph.nodes[2].features="Case=Acc"
+    graph.add_enhanced_edge(1,2,"obj")
+    changes.record((0,"Test"),1,graph,before,changes.snapshot(graph))
+    assert changes.counts[(0,"Test")]==[2,1,1]
+    assert [row[3:] for row in changes.log]==[(1,"form","see","saw"),(1,"lemma","see","look"),(1,"xpos","_","VBD"),(2,"feats","_","Case=Acc"),(2,"deps","_","1:obj")]
@@ -0,0 +1,38 @@
+import subprocess
+
+import pytest
+
+import file_util
+from scripts import ROOT
+
+def python2():
+    try:
+        return subprocess.run(["python2","-c","pass"],stderr=subprocess.DEVNULL).returncode==0
+    except OSError:
+        return False
+
+def test_ordered_map_parallel_equals_serial():
+    items=list(range(1000))
+    serial=list(file_util.ordered_map(sum,items,jobs=1,chunk_size=7))
+    assert serial==[sum(items[i:i+7]) for i in range(0,1000,7)]
+    assert list(file_util.ordered_map(sum,items,jobs=3,chunk_size=7))==serial
+    assert list(file_util.ordered_map(sum,items,jobs=2,chunk_size=7,window=1))==serial
+
+def test_corrupt_sentence_index_is_rebuilt(tmp_path):
+    f_name=str(tmp_path/"a.conllu")
+    with open(f_name,"w",encoding="utf-8") as f:
+        f.write("# sent_id = s1\n1\ta\ta\tX\t_\t_\t0\troot\t_\t_\n\n# sent_id = s2\n1\tb\tb\tX\t_\t_\t0\troot\t_\t_\n\n")
+    index=file_util.SentenceIndex(f_name)
+    with open(f_name+file_util.INDEX_SUFFIX,"r",encoding="utf-8") as f:
+        header=f.readline()
+    for rows in ("0\t1\ts1\n4","0\t1\ts1\nx\t4\ts2\n"):
+        with open(f_name+file_util.INDEX_SUFFIX,"w",encoding="utf-8") as f:
+            f.write(header+rows)
+        rebuilt=file_util.SentenceIndex(f_name)
+        assert (rebuilt.offsets,rebuilt.line_nos,rebuilt.sent_ids)==(index.offsets,index.line_nos,index.sent_ids)
+        assert rebuilt.ordinal("s2")==2
+
+@pytest.mark.skipif(not python2(),reason="no python2")
+def test_imports_on_python2():
+    #validate-python2-obsolete.py imports file_util
+    subprocess.run(["python2","-c","import file_util; list(file_util.ordered_map(sum,[1,2],chunk_size=1))"],cwd=ROOT,check=True)
@@ -0,0 +1,35 @@
+import io
+import os
+import sys
+import struct
+import subprocess
+
+import pytest
+
+import file_util
+from scripts import ROOT,load_script,rows
+
+formconvert=load_script("conllu-formconvert.py")
+
+def test_headbin_head_without_number():
+    out=io.BytesIO()
+    writer=formconvert.HeadBinWriter(file_util.TreeWriter(out,closefd=False))
+    writer.write_tree([],rows(u"""
+1 a a NOUN _ _ 2 nsubj _ _
+2 b b VERB _ _ 0 root _ _
+3 c c X _ _ _ _ _ _
+"""))
+    writer.close()
+    data=out.getvalue()
+    assert data.startswith(formconvert.HeadBinWriter.MAGIC)
+    s=data.rindex(b"S")
+    n,=struct.unpack_from("<H",data,s+1)
+    assert n==3
+    assert struct.unpack_from("<3H",data,s+3)==(2,0,0)
+
+@pytest.mark.parametrize("targets",[["-f","dgraph:same.out","-f","conllx:same.out"],["-f","dgraph","-f","conllx:./same.out","-","same.out"]])
+def test_repeated_output_file_is_an_error(tmp_path,targets):
+    result=subprocess.run([sys.executable,os.path.join(ROOT,"conllu-formconvert.py")]+targets,cwd=str(tmp_path),input=b"",stdout=subprocess.PIPE,stderr=subprocess.PIPE)
+    assert result.returncode==1
+    assert b"own file" in result.stderr
+    assert os.listdir(str(tmp_path))==[]
@@ -0,0 +1,26 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from scripts import ROOT
+
+SCRIPT=os.path.join(ROOT,"v2-conversion","nmod_obl_adjudication.py")
+
+AMBIGUOUS=u"""# sent_id = amb
+1\tman\tman\tNOUN\t_\t_\t0\troot\t_\t_
+2\tin\tin\tADP\t_\t_\t3\tcase\t_\t_
+3\tcity\tcity\tNOUN\t_\t_\t1\tnmod\t_\tManualCheck=Yes
+
+"""
+
+@pytest.mark.parametrize("out",[[],["-"]])
+def test_export_to_stdout(tmp_path,out):
+    f_name=str(tmp_path/"in.conllu")
+    with open(f_name,"w",encoding="utf-8") as f:
+        f.write(AMBIGUOUS)
+    result=subprocess.run([sys.executable,SCRIPT,"--export",f_name]+out,cwd=str(tmp_path),stdout=subprocess.PIPE,stderr=subprocess.PIPE,check=True)
+    assert result.stdout.decode("utf-8").splitlines()[1]==u"1\tamb\t3\t1\tnmod\t{man} in [city]\t"
+    assert result.stderr==b"1 relations to adjudicate.\n"
+    assert sorted(os.listdir(str(tmp_path)))==["in.conllu"]
@@ -0,0 +1,24 @@
+import release_gate
+import validate
+
+BAD_FEATURE=u"# sent_id = %s\n# text = x\n1\tx\tx\tNOUN\t_\tA=B=C\t0\troot\t_\t_\n\n"
+
+def test_diagnostics_and_tag_sets_loaded_once(tmp_path,monkeypatch):
+    repo=tmp_path/"UD_Test"
+    repo.mkdir()
+    for part in ("train","test"):
+        with open(str(repo/("en_test-ud-%s.conllu"%part)),"w",encoding="utf-8") as f:
+            for i in range(3):
+                f.write(BAD_FEATURE%("%s%d"%(part,i)))
+    loaded=[]
+    load_tagsets=validate.load_tagsets
+    monkeypatch.setattr(validate,"load_tagsets",lambda lang:loaded.append(lang) or load_tagsets(lang))
+    release_gate.load_tagsets.cache_clear()
+    report=release_gate.check_repo(str(repo),max_diagnostics=2)
+    release_gate.load_tagsets.cache_clear()
+    assert loaded==["en"]
+    train=report["files"]["en_test-ud-train.conllu"]
+    assert train["errors"]["Morpho"]==3
+    assert [(d["line"],d["sent_id"],d["test_id"]) for d in train["diagnostics"]]==[(3,"train0","invalid-feature"),(7,"train1","invalid-feature")]
+    assert train["diagnostics"][0]["file"].endswith("en_test-ud-train.conllu")
+    assert validate.record_observer is None
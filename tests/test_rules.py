@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+import convert
+import rules
+from scripts import ROOT
+
+V1=u"""# sent_id = s1
+# text = John did not eat apples , pears and plums in the garden .
+1\tJohn\tJohn\tPROPN\tNNP\t_\t4\tnsubj\t_\t_
+2\tdid\tdo\tAUX\tVBD\t_\t4\taux\t_\t_
+3\tnot\tnot\tPART\tRB\t_\t4\tneg\t_\t_
+4\teat\teat\tVERB\tVB\t_\t0\troot\t_\t_
+5\tapples\tapple\tNOUN\tNNS\t_\t4\tdobj\t_\t_
+6\t,\t,\tPUNCT\t,\t_\t5\tpunct\t_\t_
+7\tpears\tpear\tNOUN\tNNS\t_\t5\tconj\t_\t_
+8\tand\tand\tCONJ\tCC\t_\t5\tcc\t_\t_
+9\tplums\tplum\tNOUN\tNNS\t_\t5\tconj\t_\t_
+10\tin\tin\tADP\tIN\t_\t12\tcase\t_\t_
+11\tthe\tthe\tDET\tDT\t_\t12\tdet\t_\t_
+12\tgarden\tgarden\tNOUN\tNN\t_\t4\tnmod\t_\t_
+13\t.\t.\tPUNCT\t.\t_\t4\tpunct\t_\t_
+
+# sent_id = s2
+# text = The book on the table was written by New York Times .
+1\tThe\tthe\tDET\tDT\t_\t2\tdet\t_\t_
+2\tbook\tbook\tNOUN\tNN\t_\t7\tnsubjpass\t_\t_
+3\ton\ton\tADP\tIN\t_\t5\tcase\t_\t_
+4\tthe\tthe\tDET\tDT\t_\t5\tdet\t_\t_
+5\ttable\ttable\tNOUN\tNN\t_\t2\tnmod\t_\t_
+6\twas\tbe\tAUX\tVBD\t_\t7\tauxpass\t_\t_
+7\twritten\twrite\tVERB\tVBN\t_\t0\troot\t_\t_
+8\tby\tby\tADP\tIN\t_\t10\tcase\t_\t_
+9\tNew\tNew\tPROPN\tNNP\t_\t10\tname\t_\t_
+10\tYork\tYork\tPROPN\tNNP\t_\t7\tnmod\t_\t_
+11\tTimes\tTimes\tPROPN\tNNP\t_\t10\tmwe\t_\t_
+12\t.\t.\tPUNCT\t.\t_\t7\tpunct\t_\t_
+
+# sent_id = s3
+# text = He is a friend of mine , no ?
+1\tHe\the\tPRON\tPRP\t_\t4\tnsubj\t_\t_
+2\tis\tbe\tVERB\tVBZ\t_\t4\tcop\t_\t_
+3\ta\ta\tDET\tDT\t_\t4\tdet\t_\t_
+4\tfriend\tfriend\tNOUN\tNN\t_\t0\troot\t_\t_
+5\tof\tof\tADP\tIN\t_\t6\tcase\t_\t_
+6\tmine\tmine\tPRON\tPRP\t_\t4\tnmod\t_\t_
+7\t,\t,\tPUNCT\t,\t_\t4\tpunct\t_\t_
+8\tno\tno\tDET\tDT\t_\t4\tneg\t_\t_
+9\t?\t?\tPUNCT\t.\t_\t4\tpunct\t_\t_
+
+"""
+
+def write(tmp_path,text):
+    f_name=str(tmp_path/"test.rules")
+    with open(f_name,"w",encoding="utf-8") as f:
+        f.write(text)
+    return f_name
+
+def convert_text(monkeypatch,processors,text):
+    monkeypatch.setattr(convert,"processors",convert.processors)
+    monkeypatch.setattr(convert,"pipeline",convert.pipeline)
+    convert.set_pipeline(processors)
+    return "".join(convert.convert_sentence(lines) for lines in convert.read_sentences(text.splitlines(True)))
+
+def test_overlapping_rules_change_once(tmp_path,monkeypatch):
+    processors=rules.load_rules(write(tmp_path,u"""
+node node.upos=PRON -> upos=PRON misc+=A=1
+node node.form=it -> upos=PRON misc+=A=1
+edge dobj -> reln=obj misc+=B=1
+edge dobj dep.upos=PRON -> reln=obj misc+=B=1
+edge * -> misc+=C=1
+"""))
+    out=convert_text(monkeypatch,processors,u"1\tsee\tsee\tVERB\t_\t_\t0\troot\t_\t_\n2\tit\tit\tPRON\t_\t_\t1\tdobj\t_\t_\n\n")
+    assert out==u"1\tsee\tsee\tVERB\t_\t_\t0\troot\t_\tC=1\n2\tit\tit\tPRON\t_\t_\t1\tobj\t_\tA=1|B=1|C=1\n\n"
+
+@pytest.mark.parametrize("text",[
+    u"edge dobj -> reln=obj\nedge dobj dep.upos=PRON -> reln=iobj\n",
+    u"edge dobj -> reln=obj\nedge * -> reln=dep\n",
+    u"node node.upos=CONJ -> upos=CCONJ\nnode node.form=and -> upos=SCONJ\n",
+])
+def test_conflicting_rules_are_an_error(tmp_path,text):
+    with pytest.raises(rules.RuleError) as e:
+        rules.load_rules(write(tmp_path,text))
+    assert e.value.line_no==2
+
+def test_disjoint_rules_do_not_conflict(tmp_path):
+    rules.load_rules(write(tmp_path,u"edge neg dep.upos=ADV|PART -> reln=advmod\nedge neg dep.upos=DET -> reln=det\n"))
+
+def test_v1_to_v2_rules_equal_the_processors(monkeypatch):
+    default=convert_text(monkeypatch,convert.processors,V1)
+    loaded=convert_text(monkeypatch,rules.load_rules(os.path.join(ROOT,"v2-conversion","v1_to_v2.rules")),V1)
+    assert loaded==default
+    assert u"\tobl\t" in default and u"ManualCheck=Yes" in default
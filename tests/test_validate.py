@@ -0,0 +1,43 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from scripts import ROOT
+
+VALIDATE=os.path.join(ROOT,"validate.py")
+
+def run(args,stdin=None):
+    return subprocess.run([sys.executable,VALIDATE,"--lang=testsuite"]+args,input=stdin,stdout=subprocess.PIPE,stderr=subprocess.PIPE,universal_newlines=True)
+
+@pytest.fixture
+def two_sentences(tmp_path):
+    f_name=str(tmp_path/"two.conllu")
+    with open(f_name,"w",encoding="utf-8") as f:
+        for sid in ("s1","s2"):
+            f.write("# sent_id = %s\n# text = a\n1\ta\ta\tX\t_\t_\t0\troot\t_\t_\n\n"%sid)
+    return f_name
+
+@pytest.mark.parametrize("args,message",[
+    (["--sentence","3"],"--sentence 3: "),
+    (["--sentence","0"],"--sentence 0: "),
+    (["--sent-id","nope"],"no sentence with sent_id nope"),
+])
+def test_bad_selection_is_a_usage_error(two_sentences,args,message):
+    result=run(args+[two_sentences])
+    assert result.returncode==2
+    assert message in result.stderr
+    assert "Exception caught" not in result.stderr
+
+def test_selection_from_stdin_is_a_usage_error(two_sentences):
+    with open(two_sentences,encoding="utf-8") as f:
+        result=run(["--sentence","1","-"],stdin=f.read())
+    assert result.returncode==2
+    assert "standard input" in result.stderr
+    assert "Exception caught" not in result.stderr
+
+def test_selection(two_sentences):
+    result=run(["--sentence","2","--sent-id","s1",two_sentences])
+    assert result.returncode==0,result.stderr
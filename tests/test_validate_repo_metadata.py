@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+import validate_repo_metadata
+
+@pytest.mark.parametrize("text",[u"{bad",u"[1]",u""])
+def test_unreadable_cache_is_empty(tmp_path,text):
+    f_name=str(tmp_path/"cache.json")
+    with open(f_name,"w",encoding="utf-8") as f:
+        f.write(text)
+    assert validate_repo_metadata.load_cache(f_name)=={}
+
+def test_malformed_cache_entries_are_misses(tmp_path):
+    for name in ("UD_A","UD_B","UD_C"):
+        (tmp_path/name).mkdir()
+    first=validate_repo_metadata.check_release(str(tmp_path),{},jobs=2)
+    stamp=first["UD_A"]["stamp"]
+    cache={"UD_A":{"errors":[]},"UD_B":3,"UD_C":{"stamp":stamp,"errors":[["x"]]}}
+    results=validate_repo_metadata.check_release(str(tmp_path),cache,jobs=2)
+    assert not any(r["cached"] for r in results.values())
+    assert results["UD_A"]["errors"]==first["UD_A"]["errors"]
+    cache=json.loads(json.dumps(dict((name,{"stamp":r["stamp"],"errors":r["errors"]}) for name,r in first.items())))
+    assert all(r["cached"] for r in validate_repo_metadata.check_release(str(tmp_path),cache).values())
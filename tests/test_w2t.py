@@ -0,0 +1,76 @@
+import io
+import re
+import glob
+import os
+import sys
+import subprocess
+
+import pytest
+
+import file_util
+from scripts import ROOT,load_script,rows
+
+w2t=load_script("conllu-w2t.py")
+
+MWT_TEXT=u"""# sent_id = mwt
+# text = Vámonos al mar
+1-2\tVámonos\t_\t_\t_\t_\t_\t_\t_\t_
+1\tVamos\tir\tVERB\t_\t_\t0\troot\t0:root\t_
+2\tnos\tnosotros\tPRON\t_\t_\t1\tobj\t1:obj|5:nsubj:xsubj\t_
+3-4\tal\t_\t_\t_\t_\t_\t_\t_\t_
+3\ta\ta\tADP\t_\t_\t5\tcase\t5:case\t_
+4\tel\tel\tDET\t_\t_\t5\tdet\t5:det\t_
+5\tmar\tmar\tNOUN\t_\t_\t1\tobl\t1:obl:a\tSpaceAfter=No
+
+"""
+
+def round_trip(data):
+    """Returns (token-based text, the word-based text converted back) of the CoNLL-U bytes `data`"""
+    tokens=w2t.w2t_chunk(list(file_util.trees(io.BytesIO(data))))
+    words=w2t.t2w_chunk(list(file_util.trees(io.BytesIO(tokens.encode("utf-8")))))
+    return tokens,words
+
+def test_round_trip_multiword_tokens():
+    tokens,words=round_trip(MWT_TEXT.encode("utf-8"))
+    assert u"\n1\tVámonos\t_" in tokens
+    assert u"\n1.2\tnos\tnosotros\tPRON\t_\t_\t1.1\tobj\t1.1:obj|3:nsubj:xsubj\t_\n" in tokens
+    assert u"\n2.1\ta\ta\tADP\t_\t_\t3\tcase\t3:case\t_\n" in tokens
+    assert words.encode("utf-8")==MWT_TEXT.encode("utf-8")
+
+@pytest.mark.parametrize("f_name",sorted(glob.glob(os.path.join(ROOT,"test-cases","valid","*.conllu"))))
+def test_round_trip_files(f_name):
+    with open(f_name,"rb") as f:
+        data=f.read()
+    if re.search(br"^[0-9]+\.[0-9]+\t",data,re.M): #empty nodes cannot be converted
+        with pytest.raises(ValueError):
+            round_trip(data)
+        return
+    tokens,words=round_trip(data)
+    assert words.encode("utf-8")==data
+
+def test_id_remap_is_shared():
+    tree=list(file_util.trees(io.BytesIO(MWT_TEXT.encode("utf-8"))))[0][1]
+    remap=w2t.IdRemap.from_words(tree)
+    ttree=remap.to_tokens(tree)
+    remap2=w2t.IdRemap.from_tokens(ttree)
+    assert remap2.word_ids==remap.word_ids
+    assert remap2.token_ids==remap.token_ids
+    assert remap2.to_words(ttree)==tree
+
+def test_empty_node_is_an_error():
+    with pytest.raises(ValueError):
+        w2t.get_tokens(rows(u"""
+1 a a NOUN _ _ 0 root 0:root _
+1.1 _ _ _ _ _ _ _ 1:conj _
+"""))
+
+def test_parallel_equals_serial(tmp_path):
+    f_name=str(tmp_path/"in.conllu")
+    with open(f_name,"wb") as f:
+        f.write(MWT_TEXT.encode("utf-8")*300)
+    script=os.path.join(ROOT,"conllu-w2t.py")
+    serial=subprocess.run([sys.executable,script,f_name],stdout=subprocess.PIPE,check=True).stdout
+    parallel=subprocess.run([sys.executable,script,"-j","3","--chunk-size","7",f_name],stdout=subprocess.PIPE,check=True).stdout
+    assert parallel==serial
+    back=subprocess.run([sys.executable,script,"--reverse","-j","2","--chunk-size","5"],input=parallel,stdout=subprocess.PIPE,check=True).stdout
+    assert back==MWT_TEXT.encode("utf-8")*300
@@ -22,12 +22,20 @@
 ######################################################################################
 
 
+import os
 import sys
+import io
 import argparse
+import functools
+
+# file_util.py (chunking and the ordered process pool) lives in the parent directory.
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import file_util
 
 from depgraph_utils import *
 from processors_universal import *
 from processors_en import *
+from rules import RuleError, load_rules
 
 
 ######################################################################################
@@ -51,27 +59,204 @@ processors = [UPosRenameUpdateProcessor("CONJ", "CCONJ"),
               NegationProcessor()
               ]
 
+# Consecutive rename processors are compiled into one lookup table and applied in
+# a single pass over each graph. With --rules, the pipeline is loaded from a rule file.
+# When changes are tracked, the processors are applied one at a time instead, so
+# that each change is attributed to the processor that made it.
+pipeline = fuse_processors(processors)
 
-def main():
-    
-    parser = argparse.ArgumentParser(description='Convert a CoNLL-U formatted UD treebank from v1 to v2.')
-    parser.add_argument('filename', metavar='FILENAME', type=str, help='Path to CoNLL-U file.')
-    args = parser.parse_args()
-    
-    
-    
-    f = open(args.filename, "r")
+
+def set_pipeline(new_processors):
+    global processors, pipeline
+    processors = list(new_processors)
+    pipeline = fuse_processors(processors)
+
+
+'''
+    Yields the lines of the file f a sentence at a time.
+'''
+def read_sentences(f):
     lines = []
     for line in f:
         if line.strip() == "":
             if len(lines) > 0:
-                graph = DependencyGraph(lines=lines)
-                for processor in processors:
-                    processor.process(graph)
-                graph.print_conllu()
+                yield lines
             lines = []
         else:
             lines.append(line)
+    if len(lines) > 0:
+        yield lines
+
+
+'''
+    Records, for each processor of the pipeline, how many words, relations and sentences
+    it changed, and optionally a log of the changes as rows of (sentence number, sent_id,
+    processor, word, field, old value, new value). The changes are found by comparing
+    snapshots of the graph taken before and after each processor. A word counts as changed
+    if one of its WORD_FIELDS changed, a relation if its head or its DEPS changed.
+'''
+class ChangeStats(object):
+    
+    WORD_FIELDS = ("form", "lemma", "upos", "xpos", "feats", "misc")
+    FIELDS = WORD_FIELDS + ("head", "deps")
+    
+    def __init__(self, log=False):
+        self.counts = {} # key: (position, processor name) value: [words, relations, sentences]
+        self.log = [] if log else None
+    
+    @staticmethod
+    def snapshot(graph):
+        return dict((idx, (node.form, node.lemma, node.upos, node.pos, node.features, node.misc,
+                           frozenset(graph.incomingedges[idx]), graph.deps_string(idx)))
+                    for idx, node in graph.nodes.items() if idx > 0)
+    
+    def record(self, key, sent_no, graph, before, after):
+        counts = self.counts.setdefault(key, [0, 0, 0])
+        changed = False
+        words = len(self.WORD_FIELDS)
+        for idx in sorted(after.keys()):
+            old, new = before.get(idx), after[idx]
+            if old == new:
+                continue
+            changed = True
+            if old[:words] != new[:words]:
+                counts[0] += 1
+            if old[words:] != new[words:]:
+                counts[1] += 1
+            if self.log != None:
+                sent_id = self.sentence_id(graph)
+                for i, field in enumerate(self.FIELDS):
+                    if old[i] != new[i]:
+                        old_value, new_value = old[i], new[i]
+                        if field == "head":
+                            old_value = "|".join("%s:%s" % e for e in sorted(old_value))
+                            new_value = "|".join("%s:%s" % e for e in sorted(new_value))
+                        self.log.append((sent_no, sent_id, key[1], idx, field, old_value, new_value))
+        if changed:
+            counts[2] += 1
+    
+    @staticmethod
+    def sentence_id(graph):
+        for comment in graph.comments:
+            if comment.startswith("# sent_id"):
+                return comment.split("=", 1)[-1].strip()
+        return "_"
+    
+    def update(self, other):
+        for key, counts in other.counts.items():
+            total = self.counts.setdefault(key, [0, 0, 0])
+            for i, count in enumerate(counts):
+                total[i] += count
+        if self.log != None:
+            self.log.extend(other.log)
+    
+    def print_stats(self, f=sys.stderr):
+        print("step\tprocessor\twords\trelations\tsentences", file=f)
+        for key in sorted(self.counts.keys()):
+            print("%d\t%s\t%d\t%d\t%d" % ((key[0] + 1, key[1]) + tuple(self.counts[key])), file=f)
+
+
+'''
+    Raises ValueError if a word of graph is attached to a HEAD which is not a word
+    of the sentence. The processors look up the governor of every edge they touch.
+'''
+def check_heads(graph):
+    for edge in graph.edges:
+        if edge.gov not in graph.nodes:
+            raise ValueError("HEAD %d of word %d does not exist" % (edge.gov, edge.dep))
+
+
+'''
+    Converts one sentence and returns it in CoNLL-U format. A sentence which cannot
+    be read into a DependencyGraph (e.g., one with multiword tokens or with a HEAD
+    which does not exist) is returned unchanged.
+    If changes is a ChangeStats, the changes made by each processor are recorded in it.
+'''
+def convert_sentence(lines, sent_no=0, changes=None):
+    try:
+        graph = DependencyGraph(lines=lines)
+        check_heads(graph)
+    except (ValueError, KeyError):
+        print("WARNING: Could not read sentence, copying it unchanged.", file=sys.stderr)
+        print("".join(lines), file=sys.stderr)
+        return "".join(line.rstrip("\r\n") + "\n" for line in lines) + "\n"
+    if changes == None:
+        for processor in pipeline:
+            processor.process(graph)
+    else:
+        for i, processor in enumerate(processors):
+            before = changes.snapshot(graph)
+            processor.process(graph)
+            changes.record((i, type(processor).__name__), sent_no, graph, before, changes.snapshot(graph))
+    return graph.to_conllu()
+
+
+'''
+    Converts a chunk of numbered sentences, i.e., (sentence number, lines) pairs.
+    Returns the converted text and the ChangeStats of the chunk, or None if
+    changes are not tracked (track is None, otherwise whether to log the changes).
+'''
+def convert_chunk(sentences, track=None):
+    changes = ChangeStats(log=track) if track != None else None
+    text = "".join(convert_sentence(lines, sent_no, changes) for sent_no, lines in sentences)
+    return text, changes
+
+
+'''
+    Yields the results of convert_chunk() for consecutive chunks of sentences, in the
+    input order. With jobs > 1 the chunks are converted in a pool of processes (see
+    file_util.ordered_map()), each of which gets the current pipeline.
+'''
+def convert_stream(sentences, jobs=1, chunk_size=500, track=None):
+    return file_util.ordered_map(functools.partial(convert_chunk, track=track), enumerate(sentences, 1),
+                                 jobs, chunk_size, initializer=set_pipeline, initargs=(processors,))
+
+
+def main():
+    
+    parser = argparse.ArgumentParser(description='Convert a CoNLL-U formatted UD treebank from v1 to v2.')
+    parser.add_argument('filename', metavar='FILENAME', type=str, help='Path to CoNLL-U file, or "-" for standard input.')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of worker processes converting the sentences. Default: %(default)d.')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Number of sentences sent to a worker at a time. Default: %(default)d.')
+    parser.add_argument('--rules', metavar='FILE', help='Load the conversion pipeline from a rule file (see rules.py and v1_to_v2.rules) instead of using the processors list.')
+    parser.add_argument('--stats', action='store_true', help='Print the number of words, relations and sentences changed by each processor to stderr.')
+    parser.add_argument('--change-log', metavar='FILE', help='Write every change to FILE, one per line: sentence number, sent_id, processor, word, field (form, lemma, upos, xpos, feats, misc, head or deps), old and new value, separated by tabs.')
+    args = parser.parse_args()
+    
+    if args.rules:
+        try:
+            set_pipeline(load_rules(args.rules))
+        except (RuleError, OSError) as e:
+            print("%s: %s" % (args.rules, e), file=sys.stderr)
+            sys.exit(1)
+    
+    if args.filename == "-":
+        f = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    else:
+        f = open(args.filename, "r", encoding="utf-8")
+    
+    track = None
+    if args.stats or args.change_log:
+        track = args.change_log != None
+        stats = ChangeStats()
+        log = open(args.change_log, "w", encoding="utf-8") if args.change_log else None
+    
+    # Each chunk is written with a single write.
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", write_through=True)
+    for text, changes in convert_stream(read_sentences(f), args.jobs, args.chunk_size, track):
+        out.write(text)
+        if changes != None:
+            stats.update(changes)
+            if log != None:
+                log.write("".join("%d\t%s\t%s\t%d\t%s\t%s\t%s\n" % row for row in changes.log))
+    out.flush()
+    f.close()
+    
+    if track != None:
+        if log != None:
+            log.close()
+        if args.stats:
+            stats.print_stats()
     
 
 if __name__ == '__main__':
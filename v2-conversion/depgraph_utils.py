@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from collections import defaultdict
+import bisect
 import sys
 
 
@@ -11,6 +12,28 @@ import sys
 
 COMMENT_START_CHAR = "#"
 
+
+'''
+    Node ids are ints for words and (N, M) tuples for empty nodes (N.M in CoNLL-U).
+'''
+def parse_id(s):
+    if "." in s:
+        n, m = s.split(".")
+        return (int(n), int(m))
+    return int(s)
+
+def id_str(idx):
+    return "%d.%d" % idx if isinstance(idx, tuple) else str(idx)
+
+'''
+    Sort key of a node id: word N sorts as (N, 0), before its empty nodes (N, 1), (N, 2), ...
+'''
+def id_key(idx):
+    return idx if isinstance(idx, tuple) else (idx, 0)
+
+def key_id(key):
+    return key if key[1] > 0 else key[0]
+
 class DependencyGraph(object):
     
     def __init__(self, lines=None):
@@ -22,6 +45,17 @@ class DependencyGraph(object):
         self.edges = set()
         self.outgoingedges = defaultdict(set)
         self.incomingedges = defaultdict(set)
+        self.relnedges = defaultdict(set)
+        self.edgerelns = defaultdict(set)
+        self.relndependents = defaultdict(list) # (gov, reln) -> sorted list of deps
+        
+        # Enhanced dependencies (DEPS). For each dependent a list of (id_key(gov), reln)
+        # kept sorted, i.e., in the order of the DEPS column, and for each governor a set
+        # of (dep, reln). The DEPS strings are cached until the parents of a node change.
+        self.empty_nodes = {}
+        self.enhancedparents = defaultdict(list)
+        self.enhancedchildren = defaultdict(set)
+        self.deps_cache = {}
         self.comments = []
         
         
@@ -32,6 +66,7 @@ class DependencyGraph(object):
     def _parse_conllu(self, lines):
         
         #extract nodes
+        enhanced_edges = []
         for line in lines:
             line = line.strip()
             if line.startswith(COMMENT_START_CHAR):
@@ -39,10 +74,18 @@ class DependencyGraph(object):
                 continue
                 
             idx, form, lemma, upos, pos, feats, _, _, deps, misc = line.split("\t")
-            idx = int(idx)
+            idx = parse_id(idx)
             node = DependencyGraphNode(idx, form, lemma=lemma, upos=upos, pos=pos, 
                                       features=feats, misc=misc, enhanced=deps)
-            self.nodes[idx] = node
+            if isinstance(idx, tuple):
+                self.empty_nodes[idx] = node
+            else:
+                self.nodes[idx] = node
+            
+            if deps != "_":
+                for dep_edge in deps.split("|"):
+                    gov, reln = dep_edge.split(":", 1)
+                    enhanced_edges.append((parse_id(gov), idx, reln))
         
         #extract edges
         for line in lines:
@@ -50,11 +93,15 @@ class DependencyGraph(object):
             if line.startswith(COMMENT_START_CHAR):
                 continue
             
-            #TODO: support enhanced dependencies
             idx, _, _, _, _, _, gov, reln, _, _ = line.split("\t")
+            if "." in idx:
+                # empty nodes only have enhanced dependencies
+                continue
             idx = int(idx)
             gov = int(gov)
             self.add_edge(gov, idx, reln)
+        
+        self.add_enhanced_edges(enhanced_edges)
          
     def get_gov(self, dep):
         gov_edges = self.incomingedges[dep]
@@ -67,73 +114,210 @@ class DependencyGraph(object):
          
     def add_edge(self, gov, dep, reln):
         edge = DependencyGraphEdge(gov, dep, reln)
+        if edge in self.edges:
+            return
         self.edges.add(edge)
         self.outgoingedges[gov].add((dep, reln))
         self.incomingedges[dep].add((gov, reln))
+        self.relnedges[reln].add(edge)
+        self.edgerelns[(gov, dep)].add(reln)
+        bisect.insort(self.relndependents[(gov, reln)], dep)
         
     def remove_edge(self, gov, dep, reln=None):
         if reln == None:
-            to_remove = set()
-            for edge in self.edges:
-                if edge.gov == gov and edge.dep == dep:
-                    to_remove.add(edge)
-                self.outgoingedges[gov].remove((dep, edge.relation))
-                self.incomingedges[dep].remove((gov, edge.relation))
-            self.edges.difference_update(to_remove)
+            for reln2 in list(self.edgerelns.get((gov, dep), ())):
+                self.remove_edge(gov, dep, reln2)
         else:
             edge = DependencyGraphEdge(gov, dep, reln)
             self.edges.remove(edge)
             self.outgoingedges[gov].remove((dep, reln))
             self.incomingedges[dep].remove((gov, reln))
+            self.relnedges[reln].remove(edge)
+            relns = self.edgerelns[(gov, dep)]
+            relns.remove(reln)
+            if not relns:
+                del self.edgerelns[(gov, dep)]
+            deps = self.relndependents[(gov, reln)]
+            del deps[bisect.bisect_left(deps, dep)]
         
     def has_edge(self, gov, dep, reln=None):
+        relns = self.edgerelns.get((gov, dep), ())
         if reln == None:
-            for edge in self.edges:
-                if edge.gov == gov and edge.dep == dep:
-                    return True
-        else:
-            edge = DependencyGraphEdge(gov, dep, reln)
-            return edge in self.edges
+            return len(relns) > 0
+        return reln in relns
     
     
     '''
-        Returns a list of node indices which are attached to gov via reln.
+        Returns a sorted list of node indices which are attached to gov via reln.
     '''
     def dependendents_with_reln(self, gov, reln):
+        return list(self.relndependents.get((gov, reln), ()))
+    
+    
+    '''
+        Returns the first node index after position which is attached to gov
+        via reln, or None if there is none.
+    '''
+    def next_dependent_with_reln(self, gov, reln, position):
+        deps = self.relndependents.get((gov, reln), ())
+        i = bisect.bisect_right(deps, position)
+        return deps[i] if i < len(deps) else None
+    
+    
+    '''
+        Returns True if gov has a dependent attached via one of the relations relns.
+    '''
+    def has_dependent_with_reln(self, gov, *relns):
+        for reln in relns:
+            if len(self.relndependents.get((gov, reln), ())) > 0:
+                return True
+        return False
+    
+    
+    '''
+        Returns a list of all edges with one of the relations relns. The list is
+        a snapshot, so edges can be added and removed while iterating over it.
+    '''
+    def edges_with_reln(self, *relns):
         results = []
-        for (dep, reln2) in self.outgoingedges[gov]:
-            if reln == reln2:
-                results.append(dep)
-        return results;
+        for reln in relns:
+            results.extend(self.relnedges[reln])
+        return results
+    
+    
+    '''
+        Adds the enhanced dependency gov -reln-> dep.
+    '''
+    def add_enhanced_edge(self, gov, dep, reln):
+        if (dep, reln) in self.enhancedchildren[gov]:
+            return
+        self.enhancedchildren[gov].add((dep, reln))
+        bisect.insort(self.enhancedparents[dep], (id_key(gov), reln))
+        self.deps_cache.pop(dep, None)
+    
+    
+    '''
+        Adds a list of enhanced dependencies (gov, dep, reln). The parent list of
+        each dependent is sorted once, however many edges it gets.
+    '''
+    def add_enhanced_edges(self, edges):
+        touched = set()
+        for (gov, dep, reln) in edges:
+            if (dep, reln) in self.enhancedchildren[gov]:
+                continue
+            self.enhancedchildren[gov].add((dep, reln))
+            self.enhancedparents[dep].append((id_key(gov), reln))
+            touched.add(dep)
+        for dep in touched:
+            self.enhancedparents[dep].sort()
+            self.deps_cache.pop(dep, None)
+    
+    
+    '''
+        Removes the enhanced dependency gov -reln-> dep, or all enhanced
+        dependencies between gov and dep if reln is None.
+    '''
+    def remove_enhanced_edge(self, gov, dep, reln=None):
+        self.remove_enhanced_edges([(gov, dep, reln)])
+    
+    
+    '''
+        Removes a list of enhanced dependencies (gov, dep, reln), reln may be None as
+        in remove_enhanced_edge(). Each affected parent list is filtered once.
+    '''
+    def remove_enhanced_edges(self, edges):
+        removed = defaultdict(set)
+        for (gov, dep, reln) in edges:
+            if reln == None:
+                for (dep2, reln2) in list(self.enhancedchildren[gov]):
+                    if dep2 == dep:
+                        self.enhancedchildren[gov].remove((dep2, reln2))
+                        removed[dep].add((id_key(gov), reln2))
+            elif (dep, reln) in self.enhancedchildren[gov]:
+                self.enhancedchildren[gov].remove((dep, reln))
+                removed[dep].add((id_key(gov), reln))
+        for dep, parents in removed.items():
+            self.enhancedparents[dep] = [p for p in self.enhancedparents[dep] if p not in parents]
+            self.deps_cache.pop(dep, None)
+    
+    def has_enhanced_edge(self, gov, dep, reln=None):
+        if reln == None:
+            return any(dep2 == dep for (dep2, _) in self.enhancedchildren[gov])
+        return (dep, reln) in self.enhancedchildren[gov]
+    
+    
+    '''
+        Returns the enhanced parents of dep as a list of (gov, reln) in DEPS order.
+    '''
+    def enhanced_parents(self, dep):
+        return [(key_id(key), reln) for (key, reln) in self.enhancedparents[dep]]
+    
+    
+    '''
+        Returns the enhanced dependents of gov as a list of (dep, reln), sorted.
+    '''
+    def enhanced_dependents(self, gov):
+        return sorted(self.enhancedchildren[gov], key=lambda e: (id_key(e[0]), e[1]))
+    
+    
+    '''
+        Returns the DEPS column of node dep, with the heads in ascending order.
+    '''
+    def deps_string(self, dep):
+        deps = self.deps_cache.get(dep)
+        if deps == None:
+            parents = self.enhancedparents[dep]
+            if len(parents) > 0:
+                deps = "|".join("%s:%s" % (id_str(key_id(key)), reln) for (key, reln) in parents)
+            else:
+                deps = "_"
+            self.deps_cache[dep] = deps
+        return deps
                     
             
                 
     
+    '''
+        Returns the graph in CoNLL-U format, including the empty line after it.
+    '''
+    def to_conllu(self):
+        rows = list(self.comments)
+        for idx in sorted(list(self.nodes.keys()) + list(self.empty_nodes.keys()), key=id_key):
+            node = self.nodes[idx] if idx in self.nodes else self.empty_nodes[idx]
+            if isinstance(idx, tuple):
+                gov, reln = "_", "_"
+            else:
+                parents = self.incomingedges[node.index]
+                gov, reln = min(parents) if len(parents) > 0 else (-1, "null")
+            if idx != 0:
+                rows.append("%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s" % (id_str(node.index),
+                                                                    node.form,
+                                                                    node.lemma,
+                                                                    node.upos,
+                                                                    node.pos,
+                                                                    node.features,
+                                                                    gov,
+                                                                    reln,
+                                                                    self.deps_string(idx),
+                                                                    node.misc))
+        rows.append("\n")
+        return "\n".join(rows)
+    
     def print_conllu(self, f=sys.stdout):
-          for comment in self.comments:
-              print(comment, file=f)
-          
-          for idx in sorted(self.nodes.keys()):
-              node = self.nodes[idx]
-              if idx > 0:
-                  parents = self.incomingedges[node.index]
-                  gov, reln = next(iter(parents)) if len(parents) > 0 else (-1, "null")
-                  print("%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s" % (node.index,
-                                                                      node.form,
-                                                                      node.lemma,
-                                                                      node.upos,
-                                                                      node.pos,
-                                                                      node.features,
-                                                                      gov,
-                                                                      reln,
-                                                                      node.enhanced,
-                                                                      node.misc), file=f)
-              
-          print(file=f)
+        f.write(self.to_conllu())
         
         
         
+'''
+    A word of a DependencyGraph. The attributes are kept in the fixed-size slot
+    array of each node rather than in per-graph attribute columns: the processors
+    read and write single node attributes, which a column layout would turn into
+    property lookups (about 4x slower per access), and nothing reads them
+    column-wise.
+'''
 class DependencyGraphNode(object):
+
+    __slots__ = ("index", "form", "lemma", "upos", "pos", "features", "misc", "enhanced")
     
     def __init__(self, index, form, lemma=None, upos=None, pos=None, features=None, enhanced=None, misc=None):
         self.index = index
@@ -146,13 +330,7 @@ class DependencyGraphNode(object):
         self.enhanced = enhanced 
     
     def __hash__(self):
-        return self.index.__hash__() + \
-                 self.form.__hash__() + \
-                 self.lemma.__hash__() + \
-                 self.upos.__hash__() + \
-                 self.pos.__hash__() + \
-                 self.features.__hash__() + \
-                 self.misc.__hash__()
+        return hash((self.index, self.form, self.lemma, self.upos, self.pos, self.features, self.misc))
     
     def __eq__(self, other):
         return self.index == other.index and \
@@ -170,13 +348,15 @@ class DependencyGraphNode(object):
         
 class DependencyGraphEdge(object):
     
+    __slots__ = ("gov", "dep", "relation")
+    
     def __init__(self, gov, dep, relation):
         self.gov = gov
         self.dep = dep
         self.relation = relation
     
     def __hash__(self):
-        return self.gov.__hash__() + self.dep.__hash__() + self.relation.__hash__()
+        return hash((self.gov, self.dep, self.relation))
         
     def __eq__(self, other):
         return self.gov == other.gov and self.dep == other.dep and self.relation == other.relation
@@ -22,10 +22,38 @@
 ######################################################################################
 
 
+import os
 import sys
 import argparse
 
 from depgraph_utils import *
+from convert import read_sentences, ChangeStats
+
+
+MANUAL_CHECK = "ManualCheck=Yes"
+DECISIONS_HEADER = "# sentence\tsent_id\tdep\tgov\treln\tcontext\tdecision"
+DECISIONS = {"1": "nmod", "2": "obl", "nmod": "nmod", "obl": "obl"}
+
+
+def needs_check(node):
+    return node.misc != None and MANUAL_CHECK in node.misc.split("|")
+
+
+def clear_check(node):
+    misc = [item for item in node.misc.split("|") if item != MANUAL_CHECK]
+    node.misc = "|".join(misc) if len(misc) > 0 else "_"
+
+
+'''
+    Sets the relation between gov and dep to decision ("nmod" or "obl") and removes the
+    ManualCheck mark of dep.
+'''
+def apply_decision(graph, gov, dep, decision):
+    for (gov2, reln) in list(graph.incomingedges[dep]):
+        if gov2 == gov and reln != decision:
+            graph.remove_edge(gov, dep, reln)
+            graph.add_edge(gov, dep, decision)
+    clear_check(graph.nodes[dep])
 
 
 def adjudicate_nmod_obl(graph):
@@ -34,7 +62,7 @@ def adjudicate_nmod_obl(graph):
     
     for idx in graph.nodes.keys():
         node = graph.nodes[idx]
-        if node.misc != None and "ManualCheck=Yes" in node.misc:
+        if needs_check(node):
             ambiguous_nodes.append(idx)
     
     if len(ambiguous_nodes) < 1:
@@ -49,35 +77,180 @@ def adjudicate_nmod_obl(graph):
         while decision != "1" and decision !="2":
             decision = input("Should %d-%s be an nmod (1) or obl (2):\n" % (node.index, node.form))
         
-        if node.misc == "ManualCheck=Yes":
-            node.misc = "_"
-        else:
-            node.misc = node.misc.replace("|ManualCheck=Yes", "")
-        
-        if decision == "2":
-            graph.remove_edge(gov, dep, "nmod")
-            graph.add_edge(gov, dep, "obl")
-        #otherwise, don't do anything, already an nmod
+        apply_decision(graph, gov, dep, DECISIONS[decision])
         
     
-    
+'''
+    Returns the words around dep (window words on each side, and the governor),
+    with the dependent in [brackets] and the governor in {braces}.
+'''
+def context(graph, gov, dep, window):
+    first = max(1, min(dep - window, gov))
+    last = max(dep + window, gov)
+    words = []
+    for idx in range(first, last + 1):
+        node = graph.nodes.get(idx)
+        if node is None:
+            continue
+        if idx == dep:
+            words.append("[%s]" % node.form)
+        elif idx == gov:
+            words.append("{%s}" % node.form)
+        elif abs(idx - dep) <= window:
+            words.append(node.form)
+        elif len(words) > 0 and words[-1] != "...":
+            words.append("...")
+    return " ".join(words)
+
+
+'''
+    Writes one line per ambiguous relation of the treebank to the decisions file f_out.
+    The decision column is left empty, to be filled in with nmod or obl.
+'''
+def export_cases(f, f_out, window):
+    print(DECISIONS_HEADER, file=f_out)
+    count = 0
+    for sent_no, lines in enumerate(read_sentences(f), 1):
+        try:
+            graph = DependencyGraph(lines=lines)
+        except (ValueError, KeyError):
+            continue
+        for dep in sorted(graph.nodes.keys()):
+            if dep > 0 and needs_check(graph.nodes[dep]):
+                gov = graph.get_gov(dep)
+                reln = min(reln for (gov2, reln) in graph.incomingedges[dep] if gov2 == gov)
+                f_out.write("%d\t%s\t%d\t%d\t%s\t%s\t\n" % (sent_no, ChangeStats.sentence_id(graph), dep, gov, reln,
+                                                               context(graph, gov, dep, window)))
+                count += 1
+    return count
+
 
+'''
+    Reads decisions files into a dict (sentence number, dep) -> (sent_id, gov, decision).
+    Rows without a decision are skipped, so partly adjudicated files can be imported.
+'''
+def read_decisions(f_names):
+    decisions = {}
+    for f_name in f_names:
+        with open(f_name, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.rstrip("\r\n")
+                if line.startswith("#") or line.strip() == "":
+                    continue
+                cols = line.split("\t")
+                if len(cols) != 7:
+                    raise ValueError("%s, line %d: expected 7 columns, got %d" % (f_name, line_no, len(cols)))
+                sent_no, sent_id, dep, gov, _, _, decision = cols
+                decision = decision.strip()
+                if decision == "":
+                    continue
+                if decision not in DECISIONS:
+                    raise ValueError("%s, line %d: the decision must be nmod or obl, not %s" % (f_name, line_no, decision))
+                key = (int(sent_no), int(dep))
+                value = (sent_id, int(gov), DECISIONS[decision])
+                if key in decisions and decisions[key] != value:
+                    raise ValueError("%s, line %d: conflicting decision for sentence %s, word %s" % (f_name, line_no, sent_no, dep))
+                decisions[key] = value
+    return decisions
+
+
+'''
+    The cursor of an import records how many sentences have been written and the size of
+    the output file at that point, so that an interrupted import can be resumed.
+'''
+def read_cursor(cursor_filename):
+    try:
+        with open(cursor_filename, "r") as f:
+            sentences, size = f.read().split()
+            return int(sentences), int(size)
+    except (OSError, ValueError):
+        return 0, 0
+
+
+def write_cursor(cursor_filename, sentences, size):
+    with open(cursor_filename + ".tmp", "w") as f:
+        f.write("%d %d\n" % (sentences, size))
+    os.replace(cursor_filename + ".tmp", cursor_filename)
+
+
+'''
+    Applies decisions to the treebank in one streaming pass. Relations without a
+    decision keep their ManualCheck mark. Returns the number of applied decisions.
+'''
+def import_decisions(f, out_filename, decisions, resume=False, checkpoint=1000):
+    cursor_filename = out_filename + ".cursor"
+    skip, size = read_cursor(cursor_filename) if resume else (0, 0)
+    f_out = open(out_filename, "r+" if skip > 0 else "w", encoding="utf-8")
+    f_out.seek(size)
+    f_out.truncate()
+    
+    applied = 0
+    sent_no = 0
+    for sent_no, lines in enumerate(read_sentences(f), 1):
+        if sent_no <= skip:
+            continue
+        try:
+            graph = DependencyGraph(lines=lines)
+        except (ValueError, KeyError):
+            f_out.write("".join(line.rstrip("\r\n") + "\n" for line in lines) + "\n")
+            continue
+        for dep in sorted(graph.nodes.keys()):
+            decision = decisions.get((sent_no, dep))
+            if decision == None:
+                continue
+            sent_id, gov, reln = decision
+            if sent_id != ChangeStats.sentence_id(graph) or not graph.has_edge(gov, dep):
+                raise ValueError("The decision for sentence %d, word %d does not match the treebank" % (sent_no, dep))
+            apply_decision(graph, gov, dep, reln)
+            applied += 1
+        f_out.write(graph.to_conllu())
+        if sent_no % checkpoint == 0:
+            f_out.flush()
+            write_cursor(cursor_filename, sent_no, f_out.tell())
+    
+    f_out.close()
+    if os.path.exists(cursor_filename):
+        os.remove(cursor_filename)
+    return applied
 
 
 def main():
     
-    parser = argparse.ArgumentParser(description='Convert a CoNLL-U formatted UD treebank from v1 to v2.')
+    parser = argparse.ArgumentParser(description='Adjudicate the ambiguous nmod/obl relations marked with ManualCheck=Yes, interactively or through a decisions file.')
     parser.add_argument('filename', metavar='FILENAME', type=str, help='Path to CoNLL-U file.')
-    parser.add_argument('out_filename', metavar='FILENAME', type=str, help='Path to output CoNLL-U file.')
+    parser.add_argument('out_filename', metavar='OUT_FILENAME', type=str, nargs='?', help='Path to output CoNLL-U file (or the decisions file with --export).')
+    parser.add_argument('--export', action='store_true', help='Write all the ambiguous relations to a decisions file (OUT_FILENAME, or standard output if it is missing or "-") instead of asking about them. Fill in the last column with nmod or obl.')
+    parser.add_argument('--context', type=int, default=5, help='Number of words shown on each side of the dependent in the decisions file. Default: %(default)d.')
+    parser.add_argument('--decisions', metavar='FILE', action='append', help='Apply the decisions in FILE instead of asking. Can be given several times to merge the work of several annotators.')
+    parser.add_argument('--resume', action='store_true', help='With --decisions, continue an interrupted import from its cursor file (OUT_FILENAME.cursor).')
     
     args = parser.parse_args()
     
+    f = open(args.filename, "r", encoding="utf-8")
     
+    if args.export:
+        if args.out_filename and args.out_filename != "-":
+            with open(args.out_filename, "w", encoding="utf-8") as f_out:
+                count = export_cases(f, f_out, args.context)
+        else:
+            count = export_cases(f, sys.stdout, args.context)
+        print("%d relations to adjudicate." % count, file=sys.stderr)
+        return
     
-    f = open(args.filename, "r")
-    f_out = open(args.out_filename, "w")
+    if not args.out_filename:
+        parser.error("the output file is required")
     
+    if args.decisions:
+        try:
+            decisions = read_decisions(args.decisions)
+            applied = import_decisions(f, args.out_filename, decisions, args.resume)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        print("%d of %d decisions applied." % (applied, len(decisions)), file=sys.stderr)
+        return
     
+    f_out = open(args.out_filename, "w")
     
     lines = []
     for line in f:
@@ -16,17 +16,16 @@ class NegationProcessor(UpdateProcessor):
         # (new_gov = old_gov and new_dep = old_dep, so we don't have to store them.)
         reln_changes = []
         
-        for edge in graph.edges:
-            if edge.relation == "neg":
-                dep = graph.nodes[edge.dep]
-                if dep.upos in ['ADV', 'PART']:
-                    reln_changes.append((edge.gov, edge.dep, "neg", "advmod"))
-                elif dep.upos == "DET":
-                    reln_changes.append((edge.gov, edge.dep, "neg", "det"))
-                else:
-                    print("WARNING: Dependent of neg relation is neither ADV, PART, nor DET." +
-                          "You'll have to manually update the relation.", file=sys.stderr)
-                    graph.print_conllu(f=sys.stderr)
+        for edge in graph.edges_with_reln("neg"):
+            dep = graph.nodes[edge.dep]
+            if dep.upos in ['ADV', 'PART']:
+                reln_changes.append((edge.gov, edge.dep, "neg", "advmod"))
+            elif dep.upos == "DET":
+                reln_changes.append((edge.gov, edge.dep, "neg", "det"))
+            else:
+                print("WARNING: Dependent of neg relation is neither ADV, PART, nor DET." +
+                      "You'll have to manually update the relation.", file=sys.stderr)
+                graph.print_conllu(f=sys.stderr)
          
         for (gov, dep, old_reln, new_reln) in reln_changes:
             graph.remove_edge(gov, dep, old_reln)
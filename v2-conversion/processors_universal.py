@@ -48,14 +48,84 @@ class RelnRenameUpdateProcessor(UpdateProcessor):
         # variables.)
         edge_changes = []
         
-        for edge in graph.edges:
-            if edge.relation == self.old_reln:
-                edge_changes.append((edge.gov, edge.dep))
+        for edge in graph.edges_with_reln(self.old_reln):
+            edge_changes.append((edge.gov, edge.dep))
                 
         for (gov, dep) in edge_changes:
             graph.remove_edge(gov, dep, self.old_reln)
             graph.add_edge(gov, dep, self.new_reln)
 
+'''
+    Applies a sequence of UPosRenameUpdateProcessors and RelnRenameUpdateProcessors
+    in one pass over the nodes and one pass over the edges of the graph. The renames
+    are composed into lookup tables, so the result is the same as applying them one
+    after another.
+'''
+class FusedRenameUpdateProcessor(UpdateProcessor):
+    
+    def __init__(self, processors):
+        self.upos_map = {}
+        self.reln_map = {}
+        for processor in processors:
+            if isinstance(processor, UPosRenameUpdateProcessor):
+                self._compose(self.upos_map, processor.old_upos, processor.new_upos)
+            else:
+                self._compose(self.reln_map, processor.old_reln, processor.new_reln)
+    
+    
+    '''
+        Adds the rename old -> new after the renames already in mapping.
+    '''
+    @staticmethod
+    def _compose(mapping, old, new):
+        for key, value in list(mapping.items()):
+            if value == old:
+                mapping[key] = new
+        if old not in mapping:
+            mapping[old] = new
+        for key, value in list(mapping.items()):
+            if key == value:
+                del mapping[key]
+
+
+    def process(self, graph):
+        if self.upos_map:
+            for node in graph.nodes.values():
+                new_upos = self.upos_map.get(node.upos)
+                if new_upos is not None:
+                    node.upos = new_upos
+        
+        if self.reln_map:
+            edge_changes = []
+            for edge in graph.edges:
+                new_reln = self.reln_map.get(edge.relation)
+                if new_reln is not None:
+                    edge_changes.append((edge.gov, edge.dep, edge.relation, new_reln))
+            
+            for (gov, dep, old_reln, new_reln) in edge_changes:
+                graph.remove_edge(gov, dep, old_reln)
+                graph.add_edge(gov, dep, new_reln)
+
+
+'''
+    Returns a copy of the processor list with each run of consecutive rename
+    processors replaced by a single FusedRenameUpdateProcessor.
+'''
+def fuse_processors(processors):
+    fused = []
+    renames = []
+    for processor in processors:
+        if isinstance(processor, (UPosRenameUpdateProcessor, RelnRenameUpdateProcessor)):
+            renames.append(processor)
+            continue
+        if renames:
+            fused.append(FusedRenameUpdateProcessor(renames))
+            renames = []
+        fused.append(processor)
+    if renames:
+        fused.append(FusedRenameUpdateProcessor(renames))
+    return fused
+
 '''
     Splits nmod relation into nmod or oblique and marks ambiguous cases.
 '''
@@ -68,36 +138,33 @@ class NmodUpdateProcessor(UpdateProcessor):
         # (new_gov and new_dep are the same and new_reln is always "obl".)
         edge_changes = []
         
-        for edge in graph.edges:
-            if edge.relation == "nmod":
-                gov_node = graph.nodes[edge.gov]
-                dep_node = graph.nodes[edge.dep]
+        for edge in graph.edges_with_reln("nmod"):
+            gov_node = graph.nodes[edge.gov]
+            dep_node = graph.nodes[edge.dep]
 
-                ambiguous = False
+            ambiguous = False
 
 
-                #check whether gov node is a nominal
-                # also include NUM for examples such as "one of the guys"
-                # and DET for examples such as "some/all of them"
-                if gov_node.upos in ["NOUN","PRON", "PROPN", "NUM", "DET"]:
-                    #check whether nominal is a predicate (either has a nsubj/csubj dependendent
-                    # or a copula dependent)
-                    for gov_edge in graph.outgoingedges[gov_node.index]:
-                        if gov_edge[1] in ["nsubj", "csubj", "nsubjpass", "csubjpass", "nsubj:pass", "csubj:pass", "cop"]:
-                            ambiguous = True
-                            break
-                
-                elif gov_node.upos in ["VERB","AUX", "ADJ", "ADV"]:
-                    # Change dependents of predicate to "obl".
-                    edge_changes.append((edge.gov, edge.dep, edge.relation))
-                
-                else:
+            #check whether gov node is a nominal
+            # also include NUM for examples such as "one of the guys"
+            # and DET for examples such as "some/all of them"
+            if gov_node.upos in ["NOUN","PRON", "PROPN", "NUM", "DET"]:
+                #check whether nominal is a predicate (either has a nsubj/csubj dependendent
+                # or a copula dependent)
+                if graph.has_dependent_with_reln(gov_node.index, "nsubj", "csubj", "nsubjpass", "csubjpass", "nsubj:pass", "csubj:pass", "cop"):
                     ambiguous = True
+            
+            elif gov_node.upos in ["VERB","AUX", "ADJ", "ADV"]:
+                # Change dependents of predicate to "obl".
+                edge_changes.append((edge.gov, edge.dep, edge.relation))
+            
+            else:
+                ambiguous = True
 
 
-                # Don't change the relation but add comment to MISC column for manual check.
-                if ambiguous:
-                    dep_node.misc = dep_node.misc + "|ManualCheck=Yes" if dep_node.misc != "_" else "ManualCheck=Yes"
+            # Don't change the relation but add comment to MISC column for manual check.
+            if ambiguous:
+                dep_node.misc = dep_node.misc + "|ManualCheck=Yes" if dep_node.misc != "_" else "ManualCheck=Yes"
 
 
             
@@ -122,42 +189,29 @@ class CoordinationReattachmentProcessor(UpdateProcessor):
         # (new_dep = old_dep and new_reln = old_reln, so we don't have to store them.)
         gov_changes = []
         
-        for edge in graph.edges:
+        for edge in graph.edges_with_reln("cc", "punct"):
             
             # reattach coordinating conjunctions
             if edge.relation == "cc":
-                conjuncts = graph.dependendents_with_reln(edge.gov, "conj")
-                conjuncts.sort()
-                f = False
-                for c in conjuncts:
-                    if c > edge.dep:
-                        gov_changes.append((edge.gov, edge.dep, edge.relation, c))
-                        f = True
-                        break
+                c = graph.next_dependent_with_reln(edge.gov, "conj", edge.dep)
+                if c != None:
+                    gov_changes.append((edge.gov, edge.dep, edge.relation, c))
                 
-                if self.verbose and not f and edge.gov < edge.dep:
+                elif self.verbose and edge.gov < edge.dep:
                     print("WARNING: No reattachement of cc!", file=sys.stderr)
                     graph.print_conllu(f=sys.stderr)
             
             # reattach punctuation
             elif edge.relation == "punct":
-                conjuncts = graph.dependendents_with_reln(edge.gov, "conj")
-                
-                if len(conjuncts) < 1:
-                    continue
-
                 dep_node = graph.nodes[edge.dep]
                 
                 #TODO: should we also include other punctuation marks? e.g., semicolons?
                 if dep_node.lemma not in  [","]:
                     continue
                 
-                conjuncts.sort()
-                
-                for c in conjuncts:
-                    if c > edge.dep:
-                        gov_changes.append((edge.gov, edge.dep, edge.relation, c))
-                        break
+                c = graph.next_dependent_with_reln(edge.gov, "conj", edge.dep)
+                if c != None:
+                    gov_changes.append((edge.gov, edge.dep, edge.relation, c))
                 
         
         for (old_gov, old_dep, old_reln, new_gov) in gov_changes:
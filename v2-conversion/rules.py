@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+
+import sys
+import shlex
+
+import processors_universal
+import processors_en
+from processors_universal import UpdateProcessor
+
+
+'''
+    Declarative conversion rules.
+
+    A rule file lists the conversion pipeline, one entry per line. Empty lines and
+    lines starting with # are ignored.
+
+        node CONSTRAINTS -> ACTIONS
+            A rule applied to every word matching all the constraints
+            (on node.ATTR). Actions: upos=NEW, misc+=Key=Value
+
+        edge RELN CONSTRAINTS -> ACTIONS
+            A rule applied to every basic dependency with the relation RELN
+            (or any relation for *) matching all the constraints (on gov.ATTR
+            and dep.ATTR). Actions: reln=NEW, misc+=Key=Value (added to the
+            MISC column of the dependent), warn=MESSAGE (the rest of the line)
+
+        processor NAME [ARGS...]
+            One of the processors in processors_universal.py or processors_en.py,
+            e.g. "processor CoordinationReattachmentProcessor".
+
+    A constraint is ATTR=V1|V2|... or ATTR!=V1|V2|..., where ATTR is one of upos,
+    xpos, lemma, form and feats of a node, or "has", the relations of the
+    dependents of a node. For example:
+
+        node node.upos=CONJ -> upos=CCONJ
+        edge nmod gov.upos=VERB|AUX|ADJ|ADV -> reln=obl
+        edge neg dep.upos!=ADV|PART|DET -> warn=Check this relation manually.
+
+    Consecutive node and edge rules are compiled into one RuleSetProcessor, which
+    looks up the candidate rules of each edge by its relation and the UPOS of its
+    dependent and applies all of them in a single pass. All the rules of a block
+    see the graph as it was before the block, so they do not feed into each other.
+    Two rules of a block which could both rewrite the same node or edge to different
+    values are reported as a RuleError when the file is loaded.
+'''
+
+
+NODE_ATTRS = {"upos": "upos", "xpos": "pos", "lemma": "lemma", "form": "form", "feats": "features"}
+
+
+class RuleError(ValueError):
+
+    def __init__(self, line_no, msg):
+        ValueError.__init__(self, "Line %d: %s" % (line_no, msg))
+        self.line_no = line_no
+        self.msg = msg
+
+
+'''
+    A constraint on attribute attr of the node role (node, gov or dep).
+'''
+class Constraint(object):
+
+    def __init__(self, role, attr, values, negated):
+        self.role = role
+        self.attr = attr
+        self.values = frozenset(values)
+        self.negated = negated
+
+    def matches(self, graph, node):
+        if self.attr == "has":
+            found = graph.has_dependent_with_reln(node.index, *self.values)
+        else:
+            found = getattr(node, NODE_ATTRS[self.attr]) in self.values
+        return found != self.negated
+
+
+    '''
+        Returns True if no node can match both this constraint and other.
+    '''
+    def disjoint(self, other):
+        if self.role != other.role or self.attr != other.attr:
+            return False
+        if not self.negated and not other.negated:
+            return not (self.values & other.values)
+        if not self.negated:
+            return self.values <= other.values
+        if not other.negated:
+            return other.values <= self.values
+        return False
+
+
+class Rule(object):
+
+    def __init__(self, line_no, kind, reln, constraints, actions):
+        self.line_no = line_no
+        self.kind = kind # "node" or "edge"
+        self.reln = reln # None for node rules, "*" for any relation
+        self.constraints = constraints
+        self.actions = actions # list of (action, value)
+
+
+    '''
+        The UPOS values this rule is indexed under, or None if the rule can
+        match any UPOS.
+    '''
+    def dispatch_upos(self):
+        role = "node" if self.kind == "node" else "dep"
+        for c in self.constraints:
+            if c.role == role and c.attr == "upos" and not c.negated:
+                return c.values
+        return None
+
+    def rewrites(self, action):
+        for (action2, value) in self.actions:
+            if action2 == action:
+                return value
+        return None
+
+    def matches(self, graph, gov, dep):
+        for c in self.constraints:
+            node = gov if c.role == "gov" else dep
+            if not c.matches(graph, node):
+                return False
+        return True
+
+
+    '''
+        Returns True if this rule and other can fire on the same node or edge and
+        rewrite it differently.
+    '''
+    def conflicts(self, other):
+        if self.kind != other.kind:
+            return False
+        if self.kind == "edge" and self.reln != other.reln and "*" not in (self.reln, other.reln):
+            return False
+        for action in ("upos", "reln"):
+            value = self.rewrites(action)
+            value2 = other.rewrites(action)
+            if value != None and value2 != None and value != value2:
+                break
+        else:
+            return False
+        for c in self.constraints:
+            for c2 in other.constraints:
+                if c.disjoint(c2):
+                    return False
+        return True
+
+
+'''
+    Applies a block of node and edge rules in one pass over the nodes and one
+    indexed pass over the edges of a graph.
+'''
+class RuleSetProcessor(UpdateProcessor):
+
+    def __init__(self, rules):
+        self.rules = rules
+        for i, rule in enumerate(rules):
+            for rule2 in rules[:i]:
+                if rule.conflicts(rule2):
+                    raise RuleError(rule.line_no, "The rule conflicts with the rule on line %d." % rule2.line_no)
+
+        # key: upos (node rules) or (reln, upos) (edge rules), None for any upos
+        self.node_index = {}
+        self.edge_index = {}
+        for rule in rules:
+            upos_values = rule.dispatch_upos() or [None]
+            for upos in upos_values:
+                if rule.kind == "node":
+                    self.node_index.setdefault(upos, []).append(rule)
+                else:
+                    self.edge_index.setdefault((rule.reln, upos), []).append(rule)
+        self.relns = set(rule.reln for rule in rules if rule.kind == "edge")
+
+
+    def process(self, graph):
+        # Rules which overlap without conflicting may make the same change twice,
+        # so the changes are collected per node and edge.
+        upos_changes = {} # key: node index value: new upos
+        misc_changes = {} # key: node index value: list of items to add
+
+        if self.node_index:
+            for node in graph.nodes.values():
+                if node.index == 0:
+                    continue
+                for rule in self.node_index.get(node.upos, []) + self.node_index.get(None, []):
+                    if rule.matches(graph, node, node):
+                        self._fire(rule, graph, node, upos_changes, None, misc_changes)
+
+        if self.relns:
+            edge_changes = {} # key: (gov, dep, old reln) value: new reln
+            edges = graph.edges if "*" in self.relns else graph.edges_with_reln(*self.relns)
+            for edge in list(edges):
+                gov = graph.nodes[edge.gov]
+                dep = graph.nodes[edge.dep]
+                for reln in (edge.relation, "*"):
+                    for rule in self.edge_index.get((reln, dep.upos), []) + self.edge_index.get((reln, None), []):
+                        if rule.matches(graph, gov, dep):
+                            self._fire(rule, graph, dep, None, (edge, edge_changes), misc_changes)
+            for (gov, dep, old_reln), new_reln in edge_changes.items():
+                graph.remove_edge(gov, dep, old_reln)
+                graph.add_edge(gov, dep, new_reln)
+
+        for idx, upos in upos_changes.items():
+            graph.nodes[idx].upos = upos
+        for idx, items in misc_changes.items():
+            node = graph.nodes[idx]
+            misc = [] if node.misc == "_" else [node.misc]
+            node.misc = "|".join(misc + items)
+
+
+    def _fire(self, rule, graph, node, upos_changes, edge_changes, misc_changes):
+        for (action, value) in rule.actions:
+            if action == "upos":
+                upos_changes[node.index] = value
+            elif action == "reln":
+                edge, changes = edge_changes
+                changes[(edge.gov, edge.dep, edge.relation)] = value
+            elif action == "misc":
+                items = misc_changes.setdefault(node.index, [])
+                if value not in items:
+                    items.append(value)
+            elif action == "warn":
+                print("WARNING: %s" % value, file=sys.stderr)
+                graph.print_conllu(f=sys.stderr)
+
+
+def parse_constraint(line_no, kind, token):
+    attr, sep, values = token.partition("=")
+    negated = attr.endswith("!")
+    if negated:
+        attr = attr[:-1]
+    role, _, attr = attr.partition(".")
+    roles = ["node"] if kind == "node" else ["gov", "dep"]
+    if not sep or not values or role not in roles or (attr not in NODE_ATTRS and attr != "has"):
+        raise RuleError(line_no, "Bad constraint %s, expected %s.ATTR=VALUES or %s.ATTR!=VALUES." % (token, "|".join(roles), "|".join(roles)))
+    return Constraint(role, attr, values.split("|"), negated)
+
+
+def parse_actions(line_no, kind, text):
+    actions = []
+    text = text.strip()
+    while text:
+        if text.startswith("warn="):
+            actions.append(("warn", text[len("warn="):].strip()))
+            break
+        token, _, text = text.partition(" ")
+        text = text.strip()
+        if token.startswith("misc+="):
+            actions.append(("misc", token[len("misc+="):]))
+        elif token.startswith("upos=") and kind == "node":
+            actions.append(("upos", token[len("upos="):]))
+        elif token.startswith("reln=") and kind == "edge":
+            actions.append(("reln", token[len("reln="):]))
+        else:
+            raise RuleError(line_no, "Bad action %s for a %s rule." % (token, kind))
+    if not actions:
+        raise RuleError(line_no, "The rule has no actions.")
+    return actions
+
+
+'''
+    Returns the list of processors given by the rule file f_name.
+'''
+def load_rules(f_name):
+    registry = {}
+    for module in (processors_universal, processors_en):
+        for name, value in vars(module).items():
+            if isinstance(value, type) and issubclass(value, UpdateProcessor):
+                registry[name] = value
+
+    processors = []
+    block = []
+    with open(f_name, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            kind, _, rest = line.partition(" ")
+            if kind == "processor":
+                args = shlex.split(rest)
+                if not args or args[0] not in registry:
+                    raise RuleError(line_no, "Unknown processor %s." % rest.strip())
+                if block:
+                    processors.append(RuleSetProcessor(block))
+                    block = []
+                try:
+                    processors.append(registry[args[0]](*args[1:]))
+                except TypeError as e:
+                    raise RuleError(line_no, str(e))
+            elif kind in ("node", "edge"):
+                pattern, arrow, actions = rest.partition("->")
+                if not arrow:
+                    raise RuleError(line_no, "The rule has no ->.")
+                tokens = pattern.split()
+                reln = None
+                if kind == "edge":
+                    if not tokens:
+                        raise RuleError(line_no, "The edge rule has no relation.")
+                    reln = tokens.pop(0)
+                constraints = [parse_constraint(line_no, kind, token) for token in tokens]
+                block.append(Rule(line_no, kind, reln, constraints, parse_actions(line_no, kind, actions)))
+            else:
+                raise RuleError(line_no, "Expected node, edge or processor, got %s." % kind)
+    if block:
+        processors.append(RuleSetProcessor(block))
+    return processors
@@ -10,6 +10,7 @@
 
 import argparse
 import io
+import json
 import os.path
 import sys
 import traceback
@@ -24,6 +25,8 @@ from collections import Counter
 import regex as re
 from typing_extensions import TypedDict
 
+import file_util
+
 THISDIR = os.path.dirname(
     os.path.realpath(os.path.abspath(__file__))
 )  # The folder where this script resides.
@@ -46,20 +49,78 @@ COLNAMES = (
 TOKENSWSPACE = MISC + 1  # one extra constant
 
 # Global variables:
+curr_fname = "-"  # The name of the file being validated
 curr_line = 0  # Current line in the input file
 sentence_line = 0  # The line in the input file on which the current sentence starts
 sentence_id = None  # The most recently read sentence id
 line_of_first_empty_node = None
 line_of_first_enhanced_orphan = None
+# Incremented by warn()  {key: error type value: its count}
+error_counter: typing.Counter[str] = Counter()
+tree_counter = 0  # The number of trees read from the current file
 
 # langspec files which you should warn about in case they are missing (can be deprel, edeprel,
 # feat_val, tokens_w_space)
 warn_on_missing_files = set()
 
+# Tests that were added after validate-python2-obsolete.py and are not done with --legacy-v1.
+LEGACY_V1_SKIPPED_TESTS = {
+    "unicode-normalization",
+    "repeated-whitespace",
+    "invalid-ehead",
+    "enhanced-0-is-not-root",
+    "enhanced-root-is-not-0",
+    "unsorted-deps-2",
+    "repeated-deps",
+    "text-trailing-whitespace",
+    "spaceafter-empty-node",
+    "spaceafter-mwt-node",
+    "right-to-left-goeswith",
+    "right-to-left-appos",
+}
+
 
 Tagset = typing.Set[str]
 
 
+# Fields of the records of --format jsonl and tsv, in the order of the tsv columns.
+RECORD_FIELDS = (
+    "type",
+    "file",
+    "line",
+    "tree",
+    "sent_id",
+    "node",
+    "level",
+    "class",
+    "test_id",
+    "message",
+)
+
+
+# If set, a function which receives the records of --format jsonl and tsv as
+# dictionaries instead of them being printed (used by release_gate.py).
+record_observer: typing.Optional[typing.Callable[[typing.Dict[str, typing.Any]], None]] = None
+
+
+def emit_record(record: typing.Dict[str, typing.Any]):
+    """
+    Print one record of the --format jsonl or tsv output to stdout. Missing
+    fields are null in jsonl and empty in tsv.
+    """
+    if record_observer is not None:
+        record_observer(record)
+    elif args.format == "jsonl":
+        print(
+            json.dumps({k: record.get(k) for k in RECORD_FIELDS}, ensure_ascii=False)
+        )
+    else:
+        cols = (
+            "" if record.get(k) is None else str(record[k]) for k in RECORD_FIELDS
+        )
+        print("\t".join(re.sub(r"[\t\n\r]", " ", c) for c in cols))
+
+
 def warn(
     msg: str,
     error_type: str,
@@ -78,17 +139,45 @@ def warn(
     the number of the line where the node appears, we can supply it via
     nodelineno. Nonzero nodelineno means that lineno value is ignored.
     If lineno is False, print the number and starting line of the current tree.
+    With --format jsonl or tsv, the warning is printed as a record instead.
     """
     global curr_fname, curr_line, sentence_line, sentence_id, error_counter, tree_counter, args
+    if args.legacy_v1 and testid in LEGACY_V1_SKIPPED_TESTS:
+        return
     error_counter[error_type] += 1
     if not args.quiet:
         if args.max_err > 0 and error_counter[error_type] == args.max_err:
-            print(
-                (f"...suppressing further errors regarding {error_type}"),
-                file=sys.stderr,
-            )
+            if args.format != "text":
+                emit_record(
+                    {
+                        "type": "suppressed",
+                        "file": curr_fname,
+                        "class": error_type,
+                        "message": f"...suppressing further errors regarding {error_type}",
+                    }
+                )
+            else:
+                print(
+                    (f"...suppressing further errors regarding {error_type}"),
+                    file=sys.stderr,
+                )
         elif args.max_err > 0 and error_counter[error_type] > args.max_err:
             pass  # suppressed
+        elif args.format != "text":
+            emit_record(
+                {
+                    "type": "error",
+                    "file": curr_fname,
+                    "line": nodelineno or (curr_line if lineno else sentence_line),
+                    "tree": None if nodelineno or lineno else tree_counter,
+                    "sent_id": sentence_id,
+                    "node": nodeid or None,
+                    "level": testlevel,
+                    "class": error_type,
+                    "test_id": testid,
+                    "message": msg,
+                }
+            )
         else:
             if len(args.input) > 1:  # several files, should report which one
                 if curr_fname == "-":
@@ -170,10 +259,12 @@ def trees(
     inp: typing.Iterable[str],
     tag_sets: typing.Dict[str, typing.Optional[Tagset]],
     args: argparse.Namespace,
+    first_line: int = 1,
 ):
     """
     `inp` a file-like object yielding lines as unicode
     `tag_sets` and `args` are needed for choosing the tests
+    `first_line` the number of the first line of `inp` in its file
 
     This function does elementary checking of the input and yields one
     sentence at a time from the input stream.
@@ -185,8 +276,7 @@ def trees(
     lines: typing.List[typing.List[str]] = []
     testlevel = 1
     testclass = "Format"
-    for line_counter, line in enumerate(inp):
-        curr_line = line_counter + 1
+    for curr_line, line in enumerate(inp, first_line):
         line = line.rstrip("\n")
         if is_whitespace(line):
             testid = "pseudo-empty-line"
@@ -1235,7 +1325,7 @@ def build_tree(sentence: typing.Sequence[UDLine]) -> typing.Optional[Tree]:
     # Presence of cycles is equivalent to presence of unreachable nodes.
     tree = Tree(nodes=nodes, children=[sorted(c) for c in children], linenos=linenos)
     projection = get_projection(0, tree)
-    unreachable = set(range(1, len(nodes) - 1)) - projection
+    unreachable = set(range(1, len(nodes))) - projection
     if unreachable:
         testid = "non-tree"
         testmessage = f"Non-tree structure. Words {','.join(str(w) for w in sorted(unreachable))} are not reachable from the root 0."
@@ -1249,14 +1339,17 @@ def get_projection(node_id: int, tree: Tree) -> typing.Set[int]:
     Like proj() above, but works with the tree data structure. Collects node ids
     in the set called projection.
     """
-    # Note: this creates a set for every descendant. Sets are normally cheap so this should not be
-    # an issue, but if it becomes one, this could be changed to use a recursive closure and a shared
-    # set
+    # The walk is iterative and adds every node to the projection once, so it takes linear
+    # time, does not run into the recursion limit on deep trees and stops on cycles (which
+    # are reported elsewhere).
+    children = tree["children"]
     projection = set([node_id])
-    for child_id in tree["children"][node_id]:
-        if child_id in projection:
-            continue  # cycle is or will be reported elsewhere
-        projection.update(get_projection(child_id, tree))
+    stack = [node_id]
+    while stack:
+        for child_id in children[stack.pop()]:
+            if child_id not in projection:
+                projection.add(child_id)
+                stack.append(child_id)
     return projection
 
 
@@ -3039,10 +3132,17 @@ def validate_lspec_annotation(tree, lang):
 # ==============================================================================
 
 
-def validate(inp, out, args, tag_sets, known_sent_ids):
+def validate(inp, out, args, tag_sets, known_sent_ids, first_line=1, observer=None):
+    """
+    `observer` an optional function called as observer(comments, sentence) on
+    every sentence read, so that other checks can share the single pass over
+    the input.
+    """
     global tree_counter
-    for comments, sentence in trees(inp, tag_sets, args):
+    for comments, sentence in trees(inp, tag_sets, args, first_line):
         tree_counter += 1
+        if observer is not None:
+            observer(comments, sentence)
         # the individual lines have been validated already in trees()
         # here go tests which are done on the whole tree
         validate_ID_sequence(sentence)  # level 1
@@ -3084,6 +3184,84 @@ def validate(inp, out, args, tag_sets, known_sent_ids):
     validate_newlines(inp)  # level 1
 
 
+def validate_legacy_v1(inp, out, args, tag_sets, known_sent_ids, first_line=1):
+    """
+    The checks of the obsolete Python 2 validator (validate-python2-obsolete.py):
+    the CoNLL-U format, the tag sets of the language, sent_id and text, and that
+    the basic dependencies form a tree. The tree is checked by build_tree()
+    instead of the recursive proj() of the old script.
+    """
+    global tree_counter
+    for comments, sentence in trees(inp, tag_sets, args, first_line):
+        tree_counter += 1
+        validate_ID_sequence(sentence)
+        validate_ID_references(sentence)
+        validate_token_ranges(sentence)
+        validate_root(sentence)
+        validate_deps(sentence)
+        tree = build_tree(sentence)
+        if tree:
+            for node_id in range(1, len(tree["nodes"])):
+                validate_left_to_right_relations(node_id, tree)
+        validate_sent_id(comments, known_sent_ids, args.lang)
+        if args.check_tree_text:
+            validate_text_meta(comments, sentence)
+    validate_newlines(inp)
+
+
+def select_sentences(fnames, args):
+    """
+    Returns a (sentence index, sorted ordinals) pair for each of the files
+    `fnames`, with the sentences selected by --sentence and --sent-id. A
+    --sentence number must exist in every file and a --sent-id in at least one
+    of them, otherwise ValueError is raised with a message for the user.
+    """
+    if "-" in fnames:
+        raise ValueError(
+            "--sentence and --sent-id read the input through a sentence index and need file names, not standard input."
+        )
+    for ordinal in args.sentence:
+        if ordinal < 1:
+            raise ValueError(f"--sentence {ordinal}: sentences are numbered from 1.")
+    selections = []
+    found_ids = set()
+    for fname in fnames:
+        index = file_util.SentenceIndex(fname)
+        for ordinal in args.sentence:
+            if ordinal > len(index):
+                raise ValueError(
+                    f"--sentence {ordinal}: {fname} has only {len(index)} sentences."
+                )
+        selected = set(args.sentence)
+        for sid in args.sent_id:
+            if sid in index.by_id:
+                selected.add(index.ordinal(sid))
+                found_ids.add(sid)
+        selections.append((index, sorted(selected)))
+    missing = [sid for sid in args.sent_id if sid not in found_ids]
+    if missing:
+        raise ValueError(
+            f"--sent-id: no sentence with sent_id {', '.join(missing)} in {', '.join(fnames)}."
+        )
+    return selections
+
+
+def validate_selected(index, ordinals, out, args, tag_sets, known_sent_ids):
+    """
+    Validates only the sentences `ordinals` of a file, reading them through its
+    sentence index `index` (see select_sentences()).
+    """
+    global tree_counter
+    for ordinal in ordinals:
+        line_no, data = index.read(ordinal)
+        tree_counter = ordinal - 1
+        inp = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+        if args.legacy_v1:
+            validate_legacy_v1(inp, out, args, tag_sets, known_sent_ids, first_line=line_no)
+        else:
+            validate(inp, out, args, tag_sets, known_sent_ids, first_line=line_no)
+
+
 def load_file(f_name: str) -> typing.Set[str]:
     res = set()
     with io.open(f_name, "r", encoding="utf-8") as f:
@@ -3191,7 +3369,7 @@ def load_set(
     return res
 
 
-if __name__ == "__main__":
+def build_opt_parser() -> argparse.ArgumentParser:
     opt_parser = argparse.ArgumentParser(description="CoNLL-U validation script")
 
     io_group = opt_parser.add_argument_group("Input / output options")
@@ -3202,6 +3380,14 @@ if __name__ == "__main__":
         default=False,
         help="Do not print any error messages. Exit with 0 on pass, non-zero on fail.",
     )
+    io_group.add_argument(
+        "--format",
+        choices=["text", "jsonl", "tsv"],
+        default="text",
+        help="Format of the error messages. text: human-readable messages on stderr. jsonl and tsv: one record per error on stdout, with the fields "
+        + ", ".join(RECORD_FIELDS)
+        + " (tsv with a header line), and a summary record at the end. Default: %(default)s.",
+    )
     io_group.add_argument(
         "--max-err",
         action="store",
@@ -3214,6 +3400,21 @@ if __name__ == "__main__":
         nargs="*",
         help='Input file name(s), or "-" or nothing for standard input.',
     )
+    io_group.add_argument(
+        "--sentence",
+        action="append",
+        type=int,
+        default=[],
+        metavar="N",
+        help="Only validate the N-th sentence (1-based) of each input file. Can be given several times. Uses a sentence index stored next to the file.",
+    )
+    io_group.add_argument(
+        "--sent-id",
+        action="append",
+        default=[],
+        metavar="ID",
+        help="Only validate the sentence with this sent_id. Can be given several times. Uses a sentence index stored next to the file.",
+    )
     # I don't think output makes much sense now that we allow multiple inputs, so it will default to /dev/stdout
     # io_group.add_argument('output', nargs='', help='Output file name, or "-" or nothing for standard output.')
 
@@ -3239,6 +3440,12 @@ if __name__ == "__main__":
         dest="level",
         help="Level 1: Test only CoNLL-U backbone. Level 2: UD format. Level 3: UD contents. Level 4: Language-specific labels. Level 5: Language-specific contents.",
     )
+    tree_group.add_argument(
+        "--legacy-v1",
+        action="store_true",
+        default=False,
+        help="Do the checks of the obsolete Python 2 validator (validate-python2-obsolete.py) instead of the levels: format, tag sets of the language (as on level 4) and tree structure, but not the tests added since. Overrides --level.",
+    )
     tree_group.add_argument(
         "--multiple-roots",
         action="store_false",
@@ -3264,10 +3471,28 @@ if __name__ == "__main__":
         dest="check_space_after",
         help="Do not test presence of SpaceAfter=No.",
     )
+    return opt_parser
 
-    args = opt_parser.parse_args()  # Parsed command-line arguments
-    # Incremented by warn()  {key: error type value: its count}
-    error_counter: typing.Counter[str] = Counter()
+
+def set_up(run_args: argparse.Namespace) -> typing.Dict[int, typing.Optional[typing.Set[str]]]:
+    """
+    Sets the global state used by warn() for validating with the options
+    `run_args`, adjusts the level and language, and returns the tag sets to be
+    passed to validate(). Other scripts (release_gate.py) call this before
+    validate() instead of running validate.py.
+    """
+    set_args(run_args)
+    return load_tagsets(args.lang)
+
+
+def set_args(run_args: argparse.Namespace):
+    """
+    The first half of set_up(): sets the global state and adjusts the level
+    and language of `run_args`, without loading the tag sets.
+    """
+    global args, error_counter, tree_counter
+    args = run_args
+    error_counter = Counter()
     tree_counter = 0
 
     # Level of validation
@@ -3281,9 +3506,17 @@ if __name__ == "__main__":
     # Anyways, any Feature=Value pair should be allowed at level 3 (because it may be language-specific),
     # and any word form or lemma can contain spaces (because language-specific guidelines may allow it).
     # We can also test language 'ud' on level 4; then it will require that no language-specific features are present.
-    if args.level < 4:
+    if args.legacy_v1:
+        args.level = 4
+    elif args.level < 4:
         args.lang = "ud"
 
+
+def load_tagsets(lang: str) -> typing.Dict[int, typing.Optional[typing.Set[str]]]:
+    """
+    The second half of set_up(): loads the tag sets of language `lang` (as
+    adjusted by set_args()) from the data directory.
+    """
     # sets of tags for every column that needs to be checked, plus (in v2) other sets, like the allowed tokens with space
     tagsets: typing.Dict[int, typing.Optional[typing.Set[str]]] = {
         XPOS: None,
@@ -3294,71 +3527,143 @@ if __name__ == "__main__":
         TOKENSWSPACE: None,
     }
 
-    if args.lang:
+    if lang:
         tagsets[DEPREL] = load_set(
-            "deprel.ud", "deprel." + args.lang, validate_langspec=True
+            "deprel.ud", "deprel." + lang, validate_langspec=True
         )
         # All relations available in DEPREL are also allowed in DEPS.
         # In addition, there might be relations that are only allowed in DEPS.
         # One of them, "ref", is universal and we currently mention it directly
         # in the code, although there is also a file "edeprel.ud".
-        loaded_deps = load_set(
-            "deprel.ud", "edeprel." + args.lang, validate_enhanced=True
-        )
+        loaded_deps = load_set("deprel.ud", "edeprel." + lang, validate_enhanced=True)
         tagsets[DEPS] = set().union(
             tagsets[DEPREL] if tagsets[DEPREL] is not None else set(),
             {"ref"},
             loaded_deps if loaded_deps is not None else set(),
         )
-        tagsets[FEATS] = load_set("feat_val.ud", "feat_val." + args.lang)
+        tagsets[FEATS] = load_set("feat_val.ud", "feat_val." + lang)
         tagsets[UPOS] = load_set("cpos.ud", None)
-        tagsets[TOKENSWSPACE] = load_set(
-            "tokens_w_space.ud", "tokens_w_space." + args.lang
-        )
+        tagsets[TOKENSWSPACE] = load_set("tokens_w_space.ud", "tokens_w_space." + lang)
         # ...turn into compiled regular expressions
         if tagsets[TOKENSWSPACE] is not None:
             tagsets[TOKENSWSPACE] = set(
                 re.compile(r, re.U) for r in tagsets[TOKENSWSPACE]
             )
+    return tagsets
 
-    out = sys.stdout  # hard-coding - does this ever need to be anything else?
 
-    try:
-        known_sent_ids: typing.Set[str] = set()
-        open_files = []
-        if args.input == []:
-            args.input.append("-")
-        for fname in args.input:
-            if fname == "-":
-                # Set PYTHONIOENCODING=utf-8 before starting Python. See https://docs.python.org/3/using/cmdline.html#envvar-PYTHONIOENCODING
-                # Otherwise ANSI will be read in Windows and locale-dependent encoding will be used elsewhere.
-                open_files.append(sys.stdin)
+def new_file(fname: str):
+    """
+    Resets the per-file state before validating file `fname` on its own, with
+    a new error_counter.
+    """
+    global curr_fname, curr_line, sentence_line, sentence_id, error_counter, tree_counter
+    global line_of_first_empty_node, line_of_first_enhanced_orphan
+    curr_fname = fname
+    curr_line = sentence_line = tree_counter = 0
+    sentence_id = line_of_first_empty_node = line_of_first_enhanced_orphan = None
+    error_counter = Counter()
+
+
+def validate_files(fnames, selections, out, args, tag_sets):
+    """
+    Validates the files `fnames` ("-" for stdin) one after another, either
+    whole or, if `selections` is not None, only their sentences selected by
+    select_sentences().
+    """
+    global curr_fname
+    known_sent_ids: typing.Set[str] = set()
+    open_files = []
+    for fname in fnames:
+        if fname == "-":
+            # Set PYTHONIOENCODING=utf-8 before starting Python. See https://docs.python.org/3/using/cmdline.html#envvar-PYTHONIOENCODING
+            # Otherwise ANSI will be read in Windows and locale-dependent encoding will be used elsewhere.
+            open_files.append(sys.stdin)
+        else:
+            open_files.append(io.open(fname, "r", encoding="utf-8"))
+    for i, (curr_fname, inp) in enumerate(zip(fnames, open_files)):
+        if selections is not None:
+            index, ordinals = selections[i]
+            validate_selected(index, ordinals, out, args, tag_sets, known_sent_ids)
+        elif args.legacy_v1:
+            validate_legacy_v1(inp, out, args, tag_sets, known_sent_ids)
+        else:
+            validate(inp, out, args, tag_sets, known_sent_ids)
+
+
+def print_summary(fmt: str, missing_files: typing.List[str]):
+    """
+    Prints the result of the validation in format `fmt` (see --format): the
+    error counts by class and the language-specific files which do not exist.
+    """
+    if fmt != "text":
+        if not args.quiet:
+            for filepath in missing_files:
+                emit_record(
+                    {
+                        "type": "note",
+                        "message": f"The language-specific file {filepath} does not exist.",
+                    }
+                )
+            if fmt == "jsonl":
+                summary = {
+                    "type": "summary",
+                    "passed": not error_counter,
+                    "errors": sum(error_counter.values()),
+                    "classes": dict(sorted(error_counter.items())),
+                }
+                print(json.dumps(summary, ensure_ascii=False))
             else:
-                open_files.append(io.open(fname, "r", encoding="utf-8"))
-        for curr_fname, inp in zip(args.input, open_files):
-            validate(inp, out, args, tagsets, known_sent_ids)
-    # FIXME: restrict this to a narrower exception class
-    except BaseException:
-        warn("Exception caught!", "Format")
-        # If the output is used in an HTML page, it must be properly escaped
-        # because the traceback can contain e.g. "<module>". However, escaping
-        # is beyond the goal of validation, which can be also run in a console.
-        traceback.print_exc()
-    if not error_counter:
+                for k, v in sorted(error_counter.items()):
+                    emit_record({"type": "summary", "class": k, "message": v})
+                emit_record({"type": "summary", "message": sum(error_counter.values())})
+    elif not error_counter:
         if not args.quiet:
             print("*** PASSED ***", file=sys.stderr)
-        sys.exit(0)
     else:
         if not args.quiet:
             for k, v in sorted(error_counter.items()):
                 print(f"{k} errors: {v:d}", file=sys.stderr)
             n_errors = sum(v for k, v in iter(error_counter.items()))
             print(f"*** FAILED *** with {n_errors} errors", file=sys.stderr)
+        for filepath in missing_files:
+            print(
+                f"The language-specific file {filepath} does not exist.",
+                file=sys.stderr,
+            )
+
+
+if __name__ == "__main__":
+    opt_parser = build_opt_parser()
+    args = opt_parser.parse_args()  # Parsed command-line arguments
+    tagsets = set_up(args)
+    if args.input == []:
+        args.input.append("-")
+    selections = None
+    if args.sentence or args.sent_id:
+        try:
+            selections = select_sentences(args.input, args)
+        except (OSError, ValueError) as e:
+            opt_parser.error(str(e))
+    if args.format == "tsv" and not args.quiet:
+        print("# " + "\t".join(RECORD_FIELDS))
+
+    out = sys.stdout  # hard-coding - does this ever need to be anything else?
+
+    try:
+        validate_files(args.input, selections, out, args, tagsets)
+    # FIXME: restrict this to a narrower exception class
+    except BaseException:
+        warn("Exception caught!", "Format")
+        # If the output is used in an HTML page, it must be properly escaped
+        # because the traceback can contain e.g. "<module>". However, escaping
+        # is beyond the goal of validation, which can be also run in a console.
+        traceback.print_exc()
+    missing_files = []
+    if error_counter:
         for f_name in sorted(warn_on_missing_files):
             filepath = os.path.join(THISDIR, "data", f_name + "." + args.lang)
             if not os.path.exists(filepath):
-                print(
-                    f"The language-specific file {filepath} does not exist.",
-                    file=sys.stderr,
-                )
-        sys.exit(1)
+                missing_files.append(filepath)
+    print_summary(args.format, missing_files)
+    sys.exit(1 if error_counter else 0)
@@ -4,6 +4,9 @@ This is a git pre-commit hook to verify UD guidelines are met.
 Currently implemented:
 - Required files (LICENSE.txt, train and dev files) exist
 - README file exists and contains metadata section
+
+With --release, repodir is a directory holding all the UD repositories
+(UD_*) and they are checked in parallel, with the results reported as JSON.
 """
 
 # python 2/3 compatibility stuff
@@ -11,18 +14,29 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from io import open
 
+import io
 import os
 import sys
 import re
 import argparse
 import glob
+import json
+from multiprocessing.pool import ThreadPool
 
 CURRENT_RELEASE = "UD v2.0"
+READMES = ['README.md', 'README.txt']
+LICENSE = 'LICENSE.txt'
+
+
+# the names of the regular files in repodir, from a single directory scan
+def repo_files(repodir):
+    if hasattr(os, "scandir"): # python 3.5+
+        return [entry.name for entry in os.scandir(repodir) if entry.is_file()]
+    return [f for f in os.listdir(repodir) if os.path.isfile(os.path.join(repodir, f))]
 
 
 # verify non-README files exist
-def verify_req_files(args):
-    files = [f for f in os.listdir(args.repodir[0]) if os.path.isfile(os.path.join(args.repodir[0],f))]
+def verify_req_files(repodir, files):
     found_train = False
     found_dev = False
     found_license = False
@@ -46,8 +60,7 @@ def verify_req_files(args):
 
 
 # verify metadata section of README
-def verify_readme_metadata(args):
-    READMES = ['README.md', 'README.txt']
+def verify_readme_metadata(repodir, files):
     CHANGELOG = "changelog"
     REQUIRED_FIELDS = {
         'Documentation status': ['complete', 'partial', 'stub'],
@@ -60,7 +73,7 @@ def verify_readme_metadata(args):
     }
 
     # look for README
-    files = [f for f in os.listdir(args.repodir[0]) if os.path.isfile(os.path.join(args.repodir[0],f)) and f in READMES]
+    files = [f for f in files if f in READMES]
     if len(files) == 0:
         return ("No README file found, expected one of [%s]" % ', '.join(READMES), 1)
     if len(files) > 1:
@@ -68,12 +81,10 @@ def verify_readme_metadata(args):
 
     README = []
     try:
-        f = open(os.path.join(args.repodir[0],files[0]), 'rt')
-        README = [line.strip() for line in f.readlines()]
-    except:
+        with open(os.path.join(repodir, files[0]), 'rt') as f:
+            README = [line.strip() for line in f]
+    except (IOError, OSError, UnicodeDecodeError):
         return ("Failed reading README file %s" % files[0], 1)
-    finally:
-        f.close()
 
     # get metadata lines, look for changelog
     metadata = dict()
@@ -96,12 +107,11 @@ def verify_readme_metadata(args):
             metadata[prop[0]] = prop[1]
         if line.lower() == CHANGELOG:
             if changelog_line_num > 0:
-                return ("Line %d: Found more than one changelog", 3)
+                return ("Line %d: Found more than one changelog" % i, 3)
             changelog_line_num = i
 
     if not (prefix_found and postfix_found):
-        print("Metadata section not found")
-        sys.exit(2)
+        return ("Metadata section not found", 2)
 
     # verify metadata
     for (prop_name, prop_value) in metadata.items():
@@ -124,20 +134,106 @@ def verify_readme_metadata(args):
     return (None, 0)
 
 
+TESTS = [verify_req_files, verify_readme_metadata]
+
+
+# the modification times of the files the checks read, a repo whose stamp is
+# unchanged since the last run does not need to be checked again
+def repo_stamp(repodir, files):
+    stamp = {}
+    for f in files:
+        if f in READMES or f == LICENSE:
+            stamp[f] = os.stat(os.path.join(repodir, f)).st_mtime
+    stamp["files"] = sorted(files)
+    return stamp
+
+
+# check a single repository, returns a list of (test name, error code, reason)
+def check_repo(repodir, files=None):
+    if files is None:
+        files = repo_files(repodir)
+    errors = []
+    for test_func in TESTS:
+        (reason, err_code) = test_func(repodir, files)
+        if err_code != 0:
+            errors.append((test_func.__name__, err_code, reason))
+    return errors
+
+
+def load_cache(f_name):
+    try:
+        with io.open(f_name, 'rt', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+# the errors of a cache entry if its stamp matches, None for a miss; entries
+# which are malformed or were written by another version are misses too
+def cached_errors(cached, stamp):
+    if not isinstance(cached, dict) or cached.get("stamp") != stamp:
+        return None
+    errors = cached.get("errors")
+    if not isinstance(errors, list) or not all(isinstance(e, list) and len(e) == 3 for e in errors):
+        return None
+    return errors
+
+
+# check all the UD_* repositories in parent_dir with `jobs` threads, repos whose
+# stamp matches the one in cache are not checked again
+# returns {repo name: {"errors": [...], "stamp": {...}, "cached": bool}}
+def check_release(parent_dir, cache, jobs=8):
+    repos = sorted(d for d in os.listdir(parent_dir) if d.startswith("UD_") and os.path.isdir(os.path.join(parent_dir, d)))
+
+    def check(name):
+        repodir = os.path.join(parent_dir, name)
+        try:
+            files = repo_files(repodir)
+            stamp = repo_stamp(repodir, files)
+        except (IOError, OSError) as e:
+            return name, {"errors": [["repo_files", 1, "Cannot read the repository: %s" % e]], "stamp": None, "cached": False}
+        errors = cached_errors(cache.get(name), stamp)
+        if errors is not None:
+            return name, {"errors": errors, "stamp": stamp, "cached": True}
+        errors = [list(e) for e in check_repo(repodir, files)]
+        return name, {"errors": errors, "stamp": stamp, "cached": False}
+
+    pool = ThreadPool(max(1, jobs))
+    try:
+        return dict(pool.map(check, repos))
+    finally:
+        pool.close()
+
+
 if __name__=="__main__":
     parser = argparse.ArgumentParser(description='Validate a UD repository for metadata')
-    parser.add_argument('repodir', nargs=1, help='The directory where the repo resides')
+    parser.add_argument('repodir', nargs=1, help='The directory where the repo resides, or with --release the directory holding all the repos')
+    parser.add_argument('--release', action='store_true', default=False, help='Check all the UD_* repositories in repodir and print the results as JSON. The exit code is 0 if all of them pass, 1 otherwise.')
+    parser.add_argument('--cache', metavar='FILE', help='With --release, keep the results in FILE and only check again the repositories whose README, LICENSE or list of files changed since the last run.')
+    parser.add_argument('--jobs', type=int, default=8, help='With --release, the number of repositories checked in parallel. Default %(default)d.')
     args = parser.parse_args()
 
-    TESTS = [verify_req_files, verify_readme_metadata]
+    if args.release:
+        cache = load_cache(args.cache) if args.cache else {}
+        results = check_release(args.repodir[0], cache, args.jobs)
+        if args.cache:
+            with io.open(args.cache, 'wb') as f:
+                f.write(json.dumps(dict((name, {"stamp": r["stamp"], "errors": r["errors"]}) for (name, r) in results.items() if r["stamp"] is not None), indent=1, sort_keys=True).encode("ascii"))
+        failed = sorted(name for (name, r) in results.items() if r["errors"])
+        report = {
+            "repos": dict((name, {"passed": not r["errors"], "cached": r["cached"], "errors": [{"test": t, "code": c, "reason": reason} for (t, c, reason) in r["errors"]]}) for (name, r) in results.items()),
+            "passed": len(results) - len(failed),
+            "failed": failed,
+        }
+        print(json.dumps(report, indent=1, sort_keys=True))
+        sys.exit(1 if failed else 0)
 
     passed=True
-    for test_func in TESTS:
-        (reason, err_code) = test_func(args=args)
-        if err_code != 0:
-            print("*** Repository metadata errors ***")
-            print(reason)
-            passed=False
+    for (test_name, err_code, reason) in check_repo(args.repodir[0]):
+        print("*** Repository metadata errors ***")
+        print(reason)
+        passed=False
 
     if passed:
         sys.exit(0)